@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Shared SeleniumBase browser pool for the browser tests
+
+Starting Chrome is the slowest part of every browser test, so the tests
+borrow an already running SB(uc=True) browser from this pool instead of
+launching their own. Each borrower gets a fresh window that is closed again
+on release, and a browser is relaunched after BROWSER_POOL_RECYCLE_AFTER uses.
+
+Environment:
+    BROWSER_POOL_SIZE            Maximum number of browsers kept open (default 4)
+    BROWSER_POOL_RECYCLE_AFTER   Uses before a browser is relaunched (default 100)
+"""
+
+import os
+import atexit
+import queue
+import threading
+from contextlib import contextmanager
+
+
+class _PooledBrowser:
+    """An entered SB() context together with its use count"""
+
+    def __init__(self, sb_context, sb):
+        self.sb_context = sb_context
+        self.sb = sb
+        self.uses = 0
+
+    def close(self):
+        try:
+            self.sb_context.__exit__(None, None, None)
+        except Exception as e:
+            print(f"   • ⚠️ Error closing pooled browser: {e}")
+
+
+class BrowserPool:
+    """LIFO pool of SeleniumBase browsers, launched on first demand"""
+
+    def __init__(self, size: int = None, recycle_after: int = None, **sb_kwargs):
+        self.size = size or int(os.environ.get('BROWSER_POOL_SIZE', '4'))
+        self.recycle_after = recycle_after or int(os.environ.get('BROWSER_POOL_RECYCLE_AFTER', '100'))
+        self.sb_kwargs = sb_kwargs or {'uc': True, 'ad_block_on': True, 'headless': True}
+        # LIFO keeps handing out the most recently used (warmest) browser
+        self._idle = queue.LifoQueue()
+        self._lock = threading.Lock()
+        self._launched = 0
+        self._closed = False
+
+    def _launch(self) -> _PooledBrowser:
+        from seleniumbase import SB
+
+        sb_context = SB(**self.sb_kwargs)
+        return _PooledBrowser(sb_context, sb_context.__enter__())
+
+    def _checkout(self) -> _PooledBrowser:
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+
+        with self._lock:
+            launch = self._launched < self.size
+            if launch:
+                self._launched += 1
+        if not launch:
+            # Every browser is busy; wait for one to come back
+            return self._idle.get()
+        try:
+            return self._launch()
+        except Exception:
+            with self._lock:
+                self._launched -= 1
+            raise
+
+    def _checkin(self, browser: _PooledBrowser):
+        browser.uses += 1
+        if self._closed or browser.uses >= self.recycle_after:
+            browser.close()
+            with self._lock:
+                self._launched -= 1
+        else:
+            self._idle.put(browser)
+
+    @contextmanager
+    def acquire(self):
+        """Borrow a browser; yields the SB object, opened on a new window"""
+        browser = self._checkout()
+        try:
+            browser.sb.open_new_window(switch_to=True)
+            yield browser.sb
+        finally:
+            try:
+                # Close the borrower's window and go back to the original one
+                browser.sb.driver.close()
+                browser.sb.switch_to_default_window()
+            except Exception:
+                # A browser in an unknown state is not returned to the pool
+                browser.uses = self.recycle_after
+            self._checkin(browser)
+
+    def close(self):
+        """Close every idle browser (busy ones close when they are released)"""
+        self._closed = True
+        while True:
+            try:
+                browser = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            browser.close()
+            with self._lock:
+                self._launched -= 1
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def get_browser_pool() -> BrowserPool:
+    """Return the process-wide browser pool, creating it on first use"""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = BrowserPool()
+            atexit.register(_pool.close)
+        return _pool
@@ -5,8 +5,8 @@ Debug script to test Chrome launch directly
 
 import sys
 import os
-import subprocess
-import time
+import re
+import signal
 
 # Add the current directory to the path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
@@ -19,6 +19,8 @@ def debug_chrome_launch():
     try:
         from config import config
         from web_dashboard import WebDashboard
+        from cli_version import list_profile_dirs
+        from process_utils import ProcSnapshot, ProcessHandle, process_info, wait_for_exit, wait_for_path
         
         print(f"📋 Current Configuration:")
         print(f"   • use_gui_chrome: {config.use_gui_chrome}")
@@ -28,31 +30,13 @@ def debug_chrome_launch():
         # Check VNC status
         print(f"\n🔍 VNC Status Check:")
         try:
-            # More comprehensive VNC detection
-            vnc_running = False
-            vnc_patterns = [
-                f'vncserver.*{config.vnc_display}',
-                f'Xtightvnc.*{config.vnc_display}',
-                f'tightvncserver.*{config.vnc_display}',
-                f'tigervncserver.*{config.vnc_display}',
-                f'x11vnc.*{config.vnc_display}',
-                f'vnc.*{config.vnc_display}'
-            ]
-            
-            for pattern in vnc_patterns:
-                try:
-                    result = subprocess.run(['pgrep', '-f', pattern], 
-                                          capture_output=True, text=True, timeout=5)
-                    if result.returncode == 0:
-                        vnc_running = True
-                        print(f"   • VNC Running: {vnc_running} (pattern: {pattern})")
-                        print(f"   • VNC PIDs: {result.stdout.strip()}")
-                        break
-                except Exception:
-                    continue
-            
-            if not vnc_running:
-                print(f"   • VNC Running: {vnc_running}")
+            # One alternation covering every VNC server flavour
+            vnc_pattern = r'(vncserver|Xtightvnc|tightvncserver|tigervncserver|x11vnc|vnc).*' + re.escape(config.vnc_display)
+            vnc_pids = ProcSnapshot().pids(vnc_pattern)
+            vnc_running = bool(vnc_pids)
+            print(f"   • VNC Running: {vnc_running}")
+            if vnc_running:
+                print(f"   • VNC PIDs: {' '.join(map(str, vnc_pids))}")
                 
         except Exception as e:
             print(f"   • VNC Check Error: {e}")
@@ -63,9 +47,10 @@ def debug_chrome_launch():
         print(f"\n📁 Profile Check:")
         print(f"   • Profile: {profile_name}")
         print(f"   • Profile dir: {profile_dir}")
-        print(f"   • Profile exists: {os.path.exists(profile_dir)}")
+        profile_exists = profile_name in list_profile_dirs()
+        print(f"   • Profile exists: {profile_exists}")
         
-        if not os.path.exists(profile_dir):
+        if not profile_exists:
             print(f"   ❌ Profile directory does not exist!")
             return False
         
@@ -79,29 +64,38 @@ def debug_chrome_launch():
         print(f"   • Launch result: {success}")
         
         if success:
-            # Wait and check for processes
-            print(f"\n⏳ Waiting 5 seconds for Chrome to start...")
-            time.sleep(5)
+            # The dashboard does not keep the Popen; the browser process is the
+            # one matching the profile whose parent is not another match
+            chrome_pids = ProcSnapshot().pids(f'chrome.*{re.escape(profile_dir)}')
+            browser_pids = [pid for pid in chrome_pids
+                            if (process_info(pid) or (0, ''))[0] not in chrome_pids]
+            if not browser_pids:
+                print(f"   ❌ Chrome process not found after launch")
+                return False
+            chrome_pid = browser_pids[0]
+            chrome = ProcessHandle(chrome_pid)
+            
+            # Chrome creates SingletonLock in the profile once it is up; stop
+            # waiting as soon as it appears or the process dies
+            print(f"\n⏳ Waiting up to 5 seconds for Chrome (PID {chrome_pid}) to start...")
+            lock_file = os.path.join(profile_dir, 'SingletonLock')
+            profile_locked = wait_for_path(lock_file, 5.0, pid=chrome_pid)
             
             print(f"\n🔍 Process Check:")
             try:
-                result = subprocess.run(['pgrep', '-f', f'chrome.*{profile_dir}'], 
-                                      capture_output=True, text=True, timeout=5)
-                chrome_running = result.returncode == 0
+                chrome_running = not wait_for_exit(chrome_pid, 0)
                 print(f"   • Chrome Running: {chrome_running}")
                 if chrome_running:
-                    pids = result.stdout.strip().split('\n')
-                    print(f"   • Chrome PIDs: {result.stdout.strip()}")
-                    print(f"   • Process Count: {len([pid for pid in pids if pid.strip()])}")
+                    print(f"   • Chrome PID: {chrome_pid}")
+                    print(f"   • Profile locked: {profile_locked}")
                 else:
-                    print(f"   • Chrome not found in process list")
+                    print(f"   • Chrome exited")
                     
                     # Check for any Chrome processes
                     print(f"\n🔍 Checking for any Chrome processes:")
-                    result = subprocess.run(['pgrep', '-f', 'chrome'], 
-                                          capture_output=True, text=True, timeout=5)
-                    if result.returncode == 0:
-                        print(f"   • Other Chrome processes: {result.stdout.strip()}")
+                    other_pids = ProcSnapshot().pids('chrome')
+                    if other_pids:
+                        print(f"   • Other Chrome processes: {' '.join(map(str, other_pids))}")
                     else:
                         print(f"   • No Chrome processes found")
                         
@@ -111,11 +105,14 @@ def debug_chrome_launch():
             # Clean up
             print(f"\n🧹 Cleaning up:")
             try:
-                subprocess.run(['pkill', '-f', f'chrome.*{profile_dir}'], 
-                              capture_output=True, text=True, timeout=5)
-                print(f"   • Chrome processes killed")
+                if chrome_running and chrome.send_signal(signal.SIGTERM):
+                    print(f"   • Chrome process terminated")
+                else:
+                    print(f"   • Chrome already exited")
             except Exception as e:
                 print(f"   • Cleanup error: {e}")
+            finally:
+                chrome.close()
         else:
             print(f"   ❌ Chrome launch failed!")
         
@@ -6,6 +6,7 @@ Demonstration script for the new paired task automation system
 import sys
 import os
 import json
+import itertools
 from datetime import datetime
 
 # Add the current directory to the path
@@ -93,13 +94,13 @@ def demo_paired_tasks():
         print(f"   • Remaining: {stats['remaining_count']}")
         
         # Show remaining tasks
-        remaining_tasks = state.get_remaining_tasks()
-        print(f"\n🔄 Remaining Tasks ({len(remaining_tasks)}):")
-        for i, task in enumerate(remaining_tasks[:3]):
+        remaining_count = state.count_remaining()
+        print(f"\n🔄 Remaining Tasks ({remaining_count}):")
+        for task in itertools.islice(state.iter_remaining(), 3):
             print(f"   • Task {task['index']}: {task['tweet_url'][:50]}...")
         
-        if len(remaining_tasks) > 3:
-            print(f"   • ... and {len(remaining_tasks) - 3} more remaining tasks")
+        if remaining_count > 3:
+            print(f"   • ... and {remaining_count - 3} more remaining tasks")
         
         # Simulate recovery scenario
         print(f"\n🔄 Recovery Scenario:")
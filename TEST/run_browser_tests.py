@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Run the independent browser tests concurrently
+
+The tests spend nearly all their time waiting on Chrome and VNC, so running
+them side by side (each on its own worker thread, borrowing browsers from the
+shared pool) takes about as long as the slowest test instead of the sum of all.
+"""
+
+import sys
+import os
+import time
+import asyncio
+
+# Add the current directory to the path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from test_seleniumbase import test_seleniumbase_installation, test_cloudflare_bypass
+from test_vnc_chrome_launch import test_vnc_configuration
+
+TESTS = [
+    test_seleniumbase_installation,
+    test_cloudflare_bypass,
+    test_vnc_configuration,
+]
+
+
+async def run_tests():
+    """Run every test in TESTS concurrently and return their results"""
+    results = await asyncio.gather(
+        *(asyncio.to_thread(test) for test in TESTS),
+        return_exceptions=True
+    )
+    return {test.__name__: result for test, result in zip(TESTS, results)}
+
+
+def main():
+    """Run all tests"""
+    print("🚀 Browser Tests (concurrent)")
+    print("=" * 60)
+
+    start_time = time.monotonic()
+    results = asyncio.run(run_tests())
+    elapsed = time.monotonic() - start_time
+
+    print("\n" + "=" * 60)
+    print("📊 Results:")
+    for name, result in results.items():
+        if isinstance(result, Exception):
+            print(f"   • ❌ {name}: {result}")
+        else:
+            print(f"   • {'✅' if result else '❌'} {name}")
+    print(f"\n⏱️ Finished in {elapsed:.1f}s")
+
+    success = all(result is True for result in results.values())
+    if success:
+        print("🎉 All browser tests passed!")
+    else:
+        print("❌ Some browser tests failed.")
+
+    return success
+
+
+if __name__ == "__main__":
+    main()
@@ -65,8 +65,7 @@ def test_automation_components():
         
         # Test task processing
         print("\n5. Testing Task Processing:")
-        remaining_tasks = state.get_remaining_tasks()
-        print(f"   • Remaining tasks: {len(remaining_tasks)}")
+        print(f"   • Remaining tasks: {state.count_remaining()}")
         
         # Simulate processing some tasks
         if len(state.paired_tasks) > 0:
@@ -83,8 +82,7 @@ def test_automation_components():
         print(f"   • Success rate: {stats['success_rate']:.1f}%")
         
         # Test remaining tasks after processing
-        remaining_tasks = state.get_remaining_tasks()
-        print(f"   • Remaining tasks after processing: {len(remaining_tasks)}")
+        print(f"   • Remaining tasks after processing: {state.count_remaining()}")
         
         # Test state saving/loading
         print("\n6. Testing State Persistence:")
@@ -21,7 +21,7 @@ def test_task_state_manager():
         from web_dashboard import TaskStateManager
         
         # Create a new task state manager
-        manager = TaskStateManager("test_task_state.json")
+        manager = TaskStateManager("test_task_state.msgpack")
         
         print("✅ TaskStateManager created successfully")
         
@@ -67,7 +67,7 @@ def test_task_state_manager():
         manager.update_task("test_task_1", {
             'progress': 50,
             'current': 5,
-            'logs': task_1['logs'] + ['Processing item 3', 'Processing item 4', 'Processing item 5']
+            'log_append': ['Processing item 3', 'Processing item 4', 'Processing item 5']
         })
         
         updated_task = manager.get_task("test_task_1")
@@ -81,7 +81,7 @@ def test_task_state_manager():
         print("   • State saved to file")
         
         # Create a new manager instance to test loading
-        new_manager = TaskStateManager("test_task_state.json")
+        new_manager = TaskStateManager("test_task_state.msgpack")
         loaded_tasks = new_manager.get_all_tasks()
         print(f"   • Loaded {len(loaded_tasks)} tasks from file")
         
@@ -99,8 +99,8 @@ def test_task_state_manager():
         print(f"   • Remaining tasks after cleanup: {len(remaining_tasks)}")
         
         # Clean up test file
-        if os.path.exists("test_task_state.json"):
-            os.remove("test_task_state.json")
+        if os.path.exists("test_task_state.msgpack"):
+            os.remove("test_task_state.msgpack")
             print("   • Test file cleaned up")
         
         print("\n✅ All tests passed!")
@@ -144,7 +144,7 @@ def test_page_refresh_scenario():
             update_task_status(task_id, {
                 'progress': i * 25,
                 'current': i,
-                'logs': get_task_status()[task_id]['logs'] + [f'Processing item {i}']
+                'log_append': f'Processing item {i}'
             })
             print(f"   • Progress: {i * 25}%")
         
@@ -168,7 +168,7 @@ def test_page_refresh_scenario():
         update_task_status(task_id, {
             'progress': 75,
             'current': 7,
-            'logs': get_task_status()[task_id]['logs'] + ['Processing item 7']
+            'log_append': 'Processing item 7'
         })
         
         # Verify final state
@@ -177,8 +177,8 @@ def test_page_refresh_scenario():
         print(f"   • Final log entries: {len(final_task['logs'])}")
         
         # Clean up
-        if os.path.exists("task_state.json"):
-            os.remove("task_state.json")
+        if os.path.exists("task_state.msgpack"):
+            os.remove("task_state.msgpack")
         
         print("   • ✅ Page refresh scenario completed successfully")
         return True
@@ -52,7 +52,7 @@ def test_scraper():
         except Exception as e:
             print(f"✗ Scraping failed: {e}")
         
-        scraper.cleanup()
+        scraper.cleanup(keep_alive=True)
     else:
         print("✗ Failed to initialize Chrome driver")
         print("Testing fallback requests-based scraping...")
@@ -5,24 +5,27 @@ Test script for SeleniumBase Cloudflare bypass functionality
 
 import sys
 import os
+from contextlib import ExitStack, nullcontext
 
 # Add the current directory to the path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-def test_seleniumbase_installation():
-    """Test SeleniumBase installation"""
+from browser_pool import get_browser_pool
+
+def test_seleniumbase_installation(sb=None):
+    """Test SeleniumBase installation (on the given SB instance, if any)"""
     print("🧪 Testing SeleniumBase Installation")
     print("=" * 50)
     
     try:
-        from seleniumbase import SB
+        import seleniumbase
         print("✅ SeleniumBase imported successfully")
         
         # Test basic SeleniumBase functionality
         print("\n🚀 Testing SeleniumBase with undetected-chromedriver:")
         
-        with SB(uc=True, ad_block_on=True, headless=True) as sb:
-            print("   • SeleniumBase instance created")
+        with nullcontext(sb) if sb else get_browser_pool().acquire() as sb:
+            print("   • SeleniumBase instance ready")
             
             # Test with a simple URL
             test_url = "https://www.google.com"
@@ -51,19 +54,17 @@ def test_seleniumbase_installation():
         print(f"❌ SeleniumBase test error: {e}")
         return False
 
-def test_cloudflare_bypass():
-    """Test Cloudflare bypass with a known protected site"""
+def test_cloudflare_bypass(sb=None):
+    """Test Cloudflare bypass with a known protected site (on the given SB instance, if any)"""
     print("\n🛡️ Testing Cloudflare Bypass")
     print("=" * 30)
     
     try:
-        from seleniumbase import SB
-        
         # Test with a site that typically has Cloudflare protection
         test_url = "https://www.cloudflare.com"
         print(f"   • Testing Cloudflare bypass with: {test_url}")
         
-        with SB(uc=True, ad_block_on=True, headless=True) as sb:
+        with nullcontext(sb) if sb else get_browser_pool().acquire() as sb:
             try:
                 sb.uc_open_with_reconnect(test_url, 8)
                 print("   • ✅ Successfully bypassed Cloudflare")
@@ -96,13 +97,20 @@ def main():
     
     success = True
     
-    # Test installation
-    if not test_seleniumbase_installation():
-        success = False
-    
-    # Test Cloudflare bypass
-    if not test_cloudflare_bypass():
-        success = False
+    # Run both checks in one browser
+    with ExitStack() as stack:
+        try:
+            sb = stack.enter_context(get_browser_pool().acquire())
+        except Exception:
+            sb = None  # Each test reports the problem itself
+        
+        # Test installation
+        if not test_seleniumbase_installation(sb):
+            success = False
+        
+        # Test Cloudflare bypass
+        if not test_cloudflare_bypass(sb):
+            success = False
     
     print("\n" + "=" * 60)
     if success:
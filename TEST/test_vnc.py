@@ -81,8 +81,8 @@ def test_vnc_support():
         except Exception as e:
             print(f"❌ Error opening URL: {e}")
         
-        scraper.cleanup()
-        print("\n6. Browser closed")
+        scraper.cleanup(keep_alive=True)
+        print("\n6. Browser released (closed on exit)")
     else:
         print("❌ Failed to initialize Chrome driver in GUI mode")
     
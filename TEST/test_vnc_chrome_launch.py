@@ -5,21 +5,33 @@ Test script to verify Chrome launch with VNC configuration
 
 import sys
 import os
-import subprocess
-import time
+import signal
 
-# Add the current directory to the path
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+# Add the project root to the path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+try:
+    from config import config
+    from process_utils import ProcSnapshot, ProcessHandle, wait_for_match
+    from vnc_checker import get_vnc_status
+    # Reuse the dashboard instance web_dashboard creates at import time
+    from web_dashboard import dashboard
+except ImportError as e:
+    # Reported by test_vnc_configuration() instead of a traceback at import
+    _import_error = e
+else:
+    _import_error = None
 
 def test_vnc_configuration():
     """Test VNC configuration and Chrome launch"""
     print("🧪 Testing VNC Configuration and Chrome Launch")
     print("=" * 60)
     
+    if _import_error is not None:
+        print(f"❌ Import error: {_import_error}")
+        return False
+    
     try:
-        from config import config
-        from web_dashboard import WebDashboard
-        
         print(f"📋 VNC Configuration:")
         print(f"   • use_gui_chrome: {config.use_gui_chrome}")
         print(f"   • vnc_display: {config.vnc_display}")
@@ -29,19 +41,17 @@ def test_vnc_configuration():
         # Check if VNC is running
         print(f"\n🔍 Checking VNC Status:")
         try:
-            result = subprocess.run(['pgrep', '-f', f'vncserver.*{config.vnc_display}'], 
-                                  capture_output=True, text=True, timeout=5)
-            vnc_running = result.returncode == 0
+            vnc_status = get_vnc_status(config.vnc_display)
+            vnc_running = vnc_status['running']
             print(f"   • VNC Running: {vnc_running}")
-            if vnc_running:
-                print(f"   • VNC PIDs: {result.stdout.strip()}")
+            if vnc_status['pids']:
+                print(f"   • VNC PIDs: {' '.join(map(str, vnc_status['pids']))}")
         except Exception as e:
             print(f"   • VNC Check Error: {e}")
             vnc_running = False
         
         # Test profile creation and launch
         print(f"\n🚀 Testing Profile Launch:")
-        dashboard = WebDashboard()
         
         # Create a test profile
         test_profile = "test_vnc_profile"
@@ -56,22 +66,17 @@ def test_vnc_configuration():
             print(f"   • Chrome launched: {launch_success}")
             
             if launch_success:
-                # Wait a moment for Chrome to start
-                time.sleep(3)
-                
-                # Check if Chrome is running
+                # Check if Chrome is running, giving it up to 3 seconds to start
                 print(f"\n🔍 Checking Chrome Status:")
                 profile_dir = f"chrome-data/{test_profile}"
                 try:
-                    result = subprocess.run(['pgrep', '-f', f'chrome.*{profile_dir}'], 
-                                          capture_output=True, text=True, timeout=5)
-                    chrome_running = result.returncode == 0
+                    chrome_pattern = f'chrome.*{profile_dir}'
+                    chrome_pids = wait_for_match(chrome_pattern, 3.0)
+                    chrome_running = bool(chrome_pids)
                     print(f"   • Chrome Running: {chrome_running}")
                     if chrome_running:
-                        pids = result.stdout.strip().split('\n')
-                        process_count = len([pid for pid in pids if pid.strip()])
-                        print(f"   • Chrome PIDs: {result.stdout.strip()}")
-                        print(f"   • Process Count: {process_count}")
+                        print(f"   • Chrome PIDs: {' '.join(map(str, chrome_pids))}")
+                        print(f"   • Process Count: {len(chrome_pids)}")
                     else:
                         print(f"   • Chrome not found in process list")
                 except Exception as e:
@@ -80,9 +85,12 @@ def test_vnc_configuration():
                 # Clean up
                 print(f"\n🧹 Cleaning up:")
                 try:
-                    subprocess.run(['pkill', '-f', f'chrome.*{profile_dir}'], 
-                                  capture_output=True, text=True, timeout=5)
-                    print(f"   • Chrome processes killed")
+                    # Rescan in-process so renderers started after the check are included
+                    killed = 0
+                    for pid in ProcSnapshot().pids(chrome_pattern):
+                        with ProcessHandle(pid) as chrome:
+                            killed += chrome.send_signal(signal.SIGTERM)
+                    print(f"   • Chrome processes killed: {killed}")
                 except Exception as e:
                     print(f"   • Cleanup Error: {e}")
             
@@ -96,9 +104,6 @@ def test_vnc_configuration():
         print(f"\n✅ Test completed!")
         return True
         
-    except ImportError as e:
-        print(f"❌ Import error: {e}")
-        return False
     except Exception as e:
         print(f"❌ Test error: {e}")
         return False
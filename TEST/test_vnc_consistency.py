@@ -14,7 +14,7 @@ def test_vnc_consistency():
     print("=== Testing VNC Checking Consistency ===")
     
     try:
-        from vnc_checker import check_vnc_running, check_vnc_running_simple, get_vnc_status
+        from vnc_checker import check_vnc_running, check_vnc_running_simple, get_vnc_status, clear_vnc_status_cache
         from config import config
     except ImportError as e:
         print(f"❌ Import error: {e}")
@@ -23,6 +23,9 @@ def test_vnc_consistency():
     display = config.vnc_display
     print(f"Testing VNC status on display: {display}")
     
+    # Start from a fresh probe; the checks below then all share its cached result
+    clear_vnc_status_cache()
+    
     # Test 1: Simple method
     print("\n1. Testing simple VNC check...")
     simple_running, simple_error = check_vnc_running_simple(display)
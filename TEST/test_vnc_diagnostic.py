@@ -8,29 +8,85 @@ import os
 import subprocess
 import sys
 import json
+import socket
+import asyncio
 from pathlib import Path
 
-def check_vnc_installation():
+# Add the project root to the path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from vnc_checker import get_vnc_status, clear_vnc_status_cache
+
+# VNC is probed once per run; starting the server clears the cached result
+VNC_STATUS_MAX_AGE = float('inf')
+
+def _detect_local_ip():
+    """
+    Find the address of the interface used for outbound traffic
+    
+    Connecting a UDP socket only selects a route; no packet is sent and no
+    DNS lookup is made, unlike gethostbyname(gethostname()).
+    """
+    try:
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
+            s.connect(('10.255.255.255', 1))
+            return s.getsockname()[0]
+    except OSError:
+        return '127.0.0.1'
+
+LOCAL_IP = _detect_local_ip()
+
+# Independent commands the diagnostics need, run concurrently up front
+PROBE_COMMANDS = {
+    'vncserver': ['which', 'vncserver'],
+    'vnc_version': ['vncserver', '-version'],
+    'xfce4': ['which', 'startxfce4'],
+}
+
+async def _run_probe(cmd, timeout=5):
+    """Run one command; returns (returncode, stdout) or None if it could not run"""
+    try:
+        proc = await asyncio.create_subprocess_exec(
+            *cmd, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
+        )
+    except OSError:
+        return None
+    try:
+        stdout, _ = await asyncio.wait_for(proc.communicate(), timeout)
+    except asyncio.TimeoutError:
+        proc.kill()
+        await proc.wait()
+        return None
+    return proc.returncode, stdout.decode(errors='replace')
+
+async def _run_probes():
+    """Run every command in PROBE_COMMANDS concurrently"""
+    results = await asyncio.gather(*(_run_probe(cmd) for cmd in PROBE_COMMANDS.values()))
+    return dict(zip(PROBE_COMMANDS, results))
+
+def run_probes():
+    """Collect the probe results used by the check functions"""
+    return asyncio.run(_run_probes())
+
+def check_vnc_installation(probes=None):
     """Check if VNC is properly installed"""
     print("🔍 Checking VNC Installation")
     print("============================")
     
+    probes = probes or run_probes()
+    
     # Check if vncserver command exists
     try:
-        result = subprocess.run(['which', 'vncserver'], capture_output=True, text=True)
-        if result.returncode == 0:
-            vnc_path = result.stdout.strip()
+        result = probes['vncserver']
+        if result and result[0] == 0:
+            vnc_path = result[1].strip()
             print(f"✅ VNC server found at: {vnc_path}")
             
             # Check version
-            try:
-                version_result = subprocess.run(['vncserver', '-version'], 
-                                              capture_output=True, text=True, timeout=5)
-                if version_result.returncode == 0:
-                    print(f"📋 VNC version: {version_result.stdout.strip()}")
-                else:
-                    print("⚠️  Could not get VNC version")
-            except:
+            version_result = probes['vnc_version']
+            if version_result and version_result[0] == 0:
+                print(f"📋 VNC version: {version_result[1].strip()}")
+            else:
                 print("⚠️  Could not get VNC version")
         else:
             print("❌ VNC server not found")
@@ -42,15 +98,17 @@ def check_vnc_installation():
     
     return True
 
-def check_vnc_environment():
+def check_vnc_environment(probes=None):
     """Check VNC environment setup"""
     print("\n🔍 Checking VNC Environment")
     print("============================")
     
+    probes = probes or run_probes()
+    
     # Check if XFCE is installed
     try:
-        result = subprocess.run(['which', 'startxfce4'], capture_output=True, text=True)
-        if result.returncode == 0:
+        result = probes['xfce4']
+        if result and result[0] == 0:
             print("✅ XFCE4 found")
         else:
             print("⚠️  XFCE4 not found")
@@ -96,22 +154,13 @@ def check_vnc_status():
     print("======================")
     
     try:
-        result = subprocess.run(['pgrep', '-f', 'vncserver.*:1'], 
-                              capture_output=True, text=True)
-        if result.returncode == 0:
+        status = get_vnc_status(":1", max_age=VNC_STATUS_MAX_AGE)
+        if status['running']:
             print("✅ VNC server is running on display :1")
             
-            # Get VNC process info
-            pids = result.stdout.strip().split('\n')
-            for pid in pids:
-                if pid:
-                    try:
-                        ps_result = subprocess.run(['ps', '-p', pid, '-o', 'pid,ppid,cmd'], 
-                                                 capture_output=True, text=True)
-                        if ps_result.returncode == 0:
-                            print(f"📋 Process {pid}: {ps_result.stdout.strip()}")
-                    except:
-                        pass
+            # VNC process info
+            for process in status['processes']:
+                print(f"📋 Process {process.split(None, 1)[0]}: {process}")
         else:
             print("⚠️  VNC server is not running")
             return False
@@ -139,6 +188,7 @@ def test_vnc_start():
             '-depth', '24',
             '-localhost', 'no'
         ], capture_output=True, text=True, timeout=30)
+        clear_vnc_status_cache()
         
         if result.returncode == 0:
             print("✅ VNC server started successfully")
@@ -164,19 +214,12 @@ def test_vnc_connection():
         print("⚠️  VNC is not running, cannot test connection")
         return False
     
-    # Get server IP
-    try:
-        import socket
-        hostname = socket.gethostname()
-        ip_address = socket.gethostbyname(hostname)
-        print(f"🌐 Server IP: {ip_address}")
-        print(f"🔗 VNC Connection: {ip_address}:5901")
-        print(f"📺 Display: :1")
-        print("💡 Use a VNC viewer to connect to the above address")
-        return True
-    except Exception as e:
-        print(f"❌ Error getting server IP: {e}")
-        return False
+    # Server IP (detected once at import)
+    print(f"🌐 Server IP: {LOCAL_IP}")
+    print(f"🔗 VNC Connection: {LOCAL_IP}:5901")
+    print(f"📺 Display: :1")
+    print("💡 Use a VNC viewer to connect to the above address")
+    return True
 
 def main():
     """Main diagnostic function"""
@@ -189,7 +232,8 @@ def main():
         sys.exit(1)
     
     # Run diagnostics
-    vnc_installed = check_vnc_installation()
+    probes = run_probes()
+    vnc_installed = check_vnc_installation(probes)
     if not vnc_installed:
         print("\n❌ VNC is not properly installed")
         print("💡 Please install VNC first:")
@@ -197,7 +241,7 @@ def main():
         print("   sudo apt install -y tightvncserver xfce4 xfce4-goodies")
         sys.exit(1)
     
-    check_vnc_environment()
+    check_vnc_environment(probes)
     
     if test_vnc_start():
         test_vnc_connection()
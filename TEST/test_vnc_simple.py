@@ -3,102 +3,377 @@
 Simple VNC test script
 """
 
+import io
 import os
+import selectors
+import shutil
+import signal
 import subprocess
 import sys
+import time
+from contextlib import contextmanager
+from functools import lru_cache
 
-def check_vnc_status():
-    """Check if VNC is running"""
-    print("🔍 Checking VNC status...")
+# Add the project root to the path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from persistence import dumps, read_json, write_atomic
+from process_utils import ProcessHandle, wait_for_exit, wait_for_path
+
+CHROME_USER_DATA_DIR = '/tmp/test_chrome_vnc'
+
+# Programs are looked up on PATH once; the absolute paths let subprocess
+# skip the PATH search (and use posix_spawn) on every run
+_PGREP = shutil.which('pgrep') or 'pgrep'
+_CHROME = shutil.which('google-chrome') or 'google-chrome'
+
+# Command line for the test Chrome (the URL to open is appended per launch)
+CHROME_LAUNCH_ARGS = (
+    _CHROME,
+    f'--user-data-dir={CHROME_USER_DATA_DIR}',
+    '--no-first-run',
+    '--no-default-browser-check',
+    '--disable-default-apps',
+    '--disable-popup-blocking',
+    '--disable-notifications',
+    '--start-maximized',
+    '--disable-web-security',
+    '--allow-running-insecure-content',
+    '--disable-features=TranslateUI',
+    '--disable-ipc-flooding-protection',
+    '--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+)
+
+# Set XAUTO_INTERACTIVE=1 to confirm the Chrome window by hand instead of
+# waiting for it to appear on the X display
+INTERACTIVE = os.environ.get('XAUTO_INTERACTIVE') == '1'
+
+# DISPLAY is read once; call _refresh_env() after changing the environment
+_DISPLAY = os.environ.get('DISPLAY')
+
+def _refresh_env():
+    """Re-read the cached environment values"""
+    global _DISPLAY
+    _DISPLAY = os.environ.get('DISPLAY')
+
+# Probe commands for the checks below
+VNC_PROBE = [_PGREP, '-f', 'vncserver.*:1']
+CHROME_PROBE = [_CHROME, '--version']
+
+# `google-chrome --version` starts the whole browser, so the version is kept
+# per binary (path + mtime) here and reused until Chrome is updated
+CHROME_VERSION_CACHE = os.path.expanduser('~/.cache/xauto/chrome_version.json')
+
+def _vnc_running():
+    """
+    Check for a vncserver process on display :1 by reading /proc directly
     
-    # Check if VNC server is running
-    try:
-        result = subprocess.run(['pgrep', '-f', 'vncserver.*:1'], 
-                              capture_output=True, text=True)
-        if result.returncode == 0:
-            print("✅ VNC server is running on display :1")
-            return True
+    Stops at the first match; falls back to pgrep where /proc is missing.
+    """
+    if not os.path.isdir('/proc'):
+        # Only the exit status matters, so the output is not captured
+        return subprocess.run(VNC_PROBE, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL).returncode == 0
+    
+    own_pid = str(os.getpid())
+    # One buffer is reused for every cmdline (the first 4 KiB is plenty to
+    # spot vncserver and its display argument)
+    buf = bytearray(4096)
+    with os.scandir('/proc') as entries:
+        for entry in entries:
+            if not entry.name.isdigit() or entry.name == own_pid:
+                continue
+            try:
+                fd = os.open(f'/proc/{entry.name}/cmdline', os.O_RDONLY)
+            except OSError:
+                continue
+            try:
+                n = os.readv(fd, [buf])
+            except OSError:
+                continue
+            finally:
+                os.close(fd)
+            if buf.find(b'vncserver', 0, n) != -1 and buf.find(b':1', 0, n) != -1:
+                return True
+    return False
+
+def _start_probes(cmds):
+    """Start commands without waiting; a command that cannot start is replaced by its error"""
+    procs = []
+    for cmd in cmds:
+        try:
+            # close_fds=False keeps subprocess on its posix_spawn fast path
+            procs.append(subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, close_fds=False))
+        except OSError as e:
+            procs.append(e)
+    return procs
+
+def _collect_probes(cmds, procs):
+    """
+    Drain the output of started probes as it arrives and wait for them to finish
+    
+    Returns one subprocess.CompletedProcess (bytes output) per command, or
+    the exception raised if the command could not be started.
+    """
+    output = {}
+    with selectors.DefaultSelector() as selector:
+        for proc in procs:
+            if isinstance(proc, subprocess.Popen):
+                output[proc] = ([], [])
+                selector.register(proc.stdout, selectors.EVENT_READ, output[proc][0])
+                selector.register(proc.stderr, selectors.EVENT_READ, output[proc][1])
+        
+        while selector.get_map():
+            for key, _ in selector.select():
+                chunk = os.read(key.fd, 65536)
+                if chunk:
+                    key.data.append(chunk)
+                else:
+                    selector.unregister(key.fileobj)
+                    key.fileobj.close()
+    
+    results = []
+    for cmd, proc in zip(cmds, procs):
+        if isinstance(proc, OSError):
+            results.append(proc)
         else:
-            print("❌ VNC server not running on display :1")
+            stdout, stderr = output[proc]
+            results.append(subprocess.CompletedProcess(
+                cmd, proc.wait(),
+                b''.join(stdout),
+                b''.join(stderr)
+            ))
+    return results
+
+def _cancel_probes(procs):
+    """Kill started probes whose result is no longer needed"""
+    for proc in procs:
+        if isinstance(proc, subprocess.Popen):
+            proc.kill()
+            proc.wait()
+            proc.stdout.close()
+            proc.stderr.close()
+
+def _chrome_binary():
+    """Return (path, mtime_ns) of the google-chrome found on PATH, or None"""
+    # Cheap existence check first: Chrome may have been removed since import
+    if not os.path.isabs(_CHROME) or not os.access(_CHROME, os.X_OK):
+        return None
+    try:
+        return _CHROME, os.stat(_CHROME).st_mtime_ns
+    except OSError:
+        return None
+
+def _cached_chrome_version(path, mtime):
+    """Return the version stored in CHROME_VERSION_CACHE for this binary, if any"""
+    try:
+        cached = read_json(CHROME_VERSION_CACHE)
+    except (OSError, ValueError):
+        return None
+    if cached.get('path') == path and cached.get('mtime') == mtime:
+        return cached.get('version')
+    return None
+
+def _store_chrome_version(path, mtime, version):
+    """Save the version to CHROME_VERSION_CACHE (best effort)"""
+    try:
+        os.makedirs(os.path.dirname(CHROME_VERSION_CACHE), exist_ok=True)
+        write_atomic(CHROME_VERSION_CACHE, dumps({'path': path, 'mtime': mtime, 'version': version}))
+    except OSError:
+        pass
+
+def _version_from_probe(result):
+    """Decode the version from a CHROME_PROBE run; None if Chrome did not run"""
+    if isinstance(result, Exception):
+        raise result
+    if result.returncode != 0:
+        return None
+    # Output stays bytes; only the version line is decoded
+    return result.stdout.decode('ascii', 'replace').strip()
+
+@lru_cache(maxsize=1)
+def _chrome_version(path, mtime):
+    """Chrome version for this binary, from the on-disk cache or by running it"""
+    version = _cached_chrome_version(path, mtime)
+    if version is None:
+        version = _version_from_probe(subprocess.run([path, '--version'], capture_output=True))
+        if version is not None:
+            _store_chrome_version(path, mtime, version)
+    return version
+
+@contextmanager
+def _buffered_output():
+    """Collect a check's prints and write them to stdout in one go"""
+    buf = io.StringIO()
+    try:
+        yield buf
+    finally:
+        sys.stdout.write(buf.getvalue())
+        sys.stdout.flush()
+
+def check_vnc_status():
+    """Check if VNC is running"""
+    with _buffered_output() as out:
+        print("🔍 Checking VNC status...", file=out)
+        
+        # Check if VNC server is running
+        try:
+            if _vnc_running():
+                print("✅ VNC server is running on display :1", file=out)
+                return True
+            else:
+                print("❌ VNC server not running on display :1", file=out)
+                return False
+        except Exception as e:
+            print(f"❌ Error checking VNC: {e}", file=out)
             return False
-    except Exception as e:
-        print(f"❌ Error checking VNC: {e}")
-        return False
+
+def _x_socket_path(display):
+    """Return the X socket path for a local display like ':1' (None for remote displays)"""
+    host, _, number = display.partition(':')
+    if host or not number:
+        return None
+    return f"/tmp/.X11-unix/X{number.split('.')[0]}"
 
 def check_display():
     """Check if DISPLAY is set"""
-    print("📺 Checking DISPLAY environment...")
-    
-    display = os.environ.get('DISPLAY')
-    if display:
-        print(f"✅ DISPLAY is set to: {display}")
-        return True
-    else:
-        print("❌ DISPLAY not set")
-        return False
-
-def check_chrome():
-    """Check if Chrome is installed"""
-    print("🌐 Checking Chrome installation...")
-    
-    try:
-        result = subprocess.run(['google-chrome', '--version'], 
-                              capture_output=True, text=True)
-        if result.returncode == 0:
-            version = result.stdout.strip()
-            print(f"✅ Chrome found: {version}")
+    with _buffered_output() as out:
+        print("📺 Checking DISPLAY environment...", file=out)
+        
+        if _DISPLAY:
+            print(f"✅ DISPLAY is set to: {_DISPLAY}", file=out)
+            # A local X server listens on /tmp/.X11-unix/X<n>; one stat, no subprocess
+            socket_path = _x_socket_path(_DISPLAY)
+            if socket_path and not os.path.exists(socket_path):
+                print(f"⚠️  No X server socket at {socket_path}", file=out)
             return True
         else:
-            print("❌ Chrome not found")
+            print("❌ DISPLAY not set", file=out)
             return False
-    except Exception as e:
-        print(f"❌ Error checking Chrome: {e}")
-        return False
+
+def check_chrome(result=None):
+    """Check if Chrome is installed (result: an already collected CHROME_PROBE run)"""
+    with _buffered_output() as out:
+        print("🌐 Checking Chrome installation...", file=out)
+        
+        try:
+            # Without an executable google-chrome there is nothing to run
+            binary = _chrome_binary()
+            if binary is None:
+                print("❌ Chrome not found", file=out)
+                return False
+            if result is None:
+                version = _chrome_version(*binary)
+            else:
+                version = _version_from_probe(result)
+                if version is not None:
+                    _store_chrome_version(*binary, version)
+            if version is not None:
+                print(f"✅ Chrome found: {version}", file=out)
+                return True
+            else:
+                print("❌ Chrome not found", file=out)
+                return False
+        except Exception as e:
+            print(f"❌ Error checking Chrome: {e}", file=out)
+            return False
+
+def _wait_for_chrome_window(timeout=10.0):
+    """Wait for a Chrome window to appear on the X display (xdotool, else polling xwininfo)"""
+    try:
+        if shutil.which('xdotool'):
+            result = subprocess.run(['xdotool', 'search', '--sync', '--onlyvisible', '--class', 'chrome'],
+                                    stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=timeout)
+            return result.returncode == 0
+        
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            tree = subprocess.run(['xwininfo', '-root', '-tree'], stdout=subprocess.PIPE,
+                                  stderr=subprocess.DEVNULL, timeout=timeout).stdout
+            if b'chrome' in tree.lower():
+                return True
+            time.sleep(0.2)
+    except (OSError, subprocess.TimeoutExpired):
+        pass
+    return False
+
+def _wait_for_chrome_ready(process, lock_path, timeout):
+    """
+    Wait for Chrome to create lock_path, ending early if Chrome exits
+    
+    SIGCHLD is blocked and waited for with sigtimedwait, so a crash wakes the
+    wait at once. Where sigtimedwait is missing (macOS) wait_for_path watches
+    the process through a pidfd or by polling instead.
+    """
+    if not hasattr(signal, 'sigtimedwait'):
+        return wait_for_path(lock_path, timeout, pid=process.pid)
+    
+    # Blocked only after Popen, so Chrome does not inherit the mask; an exit
+    # before this point is caught by the poll() below
+    deadline = time.monotonic() + timeout
+    old_mask = signal.pthread_sigmask(signal.SIG_BLOCK, {signal.SIGCHLD})
+    try:
+        while not os.path.lexists(lock_path):
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or process.poll() is not None:
+                return os.path.lexists(lock_path)
+            signal.sigtimedwait({signal.SIGCHLD}, min(0.1, remaining))
+        return True
+    finally:
+        signal.pthread_sigmask(signal.SIG_SETMASK, old_mask)
 
 def test_chrome_launch():
     """Test launching Chrome with VNC"""
     print("🚀 Testing Chrome launch...")
     
     # Set display
-    os.environ['DISPLAY'] = ':1'
+    global _DISPLAY
+    if _DISPLAY != ':1':
+        os.environ['DISPLAY'] = ':1'
+        _DISPLAY = ':1'
     
     try:
         # Launch Chrome in background
-        cmd = [
-            'google-chrome',
-            '--user-data-dir=/tmp/test_chrome_vnc',
-            '--no-first-run',
-            '--no-default-browser-check',
-            '--disable-default-apps',
-            '--disable-popup-blocking',
-            '--disable-notifications',
-            '--start-maximized',
-            '--disable-web-security',
-            '--allow-running-insecure-content',
-            '--disable-features=TranslateUI',
-            '--disable-ipc-flooding-protection',
-            '--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'https://twitter.com'
-        ]
+        cmd = (*CHROME_LAUNCH_ARGS, 'https://twitter.com')
+        
+        # A lock left behind by a crashed run would end the wait below early
+        singleton_lock = os.path.join(CHROME_USER_DATA_DIR, 'SingletonLock')
+        if os.path.lexists(singleton_lock):
+            os.unlink(singleton_lock)
         
-        process = subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        start_time = time.monotonic()
+        # Chrome gets its own session so a Ctrl+C in the test does not reach
+        # it (it is always stopped below), and a minimal, explicit environment
+        env = {key: os.environ[key] for key in ('PATH', 'HOME', 'XAUTHORITY') if key in os.environ}
+        env['DISPLAY'] = _DISPLAY
+        process = subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.STDOUT,
+                                   close_fds=True, start_new_session=True, env=env)
         print(f"✅ Chrome launched with PID: {process.pid}")
         
-        # Wait a bit for Chrome to start
-        import time
-        time.sleep(3)
+        # Wait (up to 3s) for Chrome to lock its profile; the wait ends
+        # immediately if Chrome exits instead
+        if _wait_for_chrome_ready(process, singleton_lock, 3.0):
+            print(f"✅ Chrome profile ready after {time.monotonic() - start_time:.2f}s")
         
         # Check if process is still running
         if process.poll() is None:
             print("✅ Chrome is running successfully")
             print("🎯 Check your VNC viewer to see the Chrome window")
             
-            # Ask user to confirm
-            input("\nPress Enter after verifying Chrome is visible in VNC...")
-            
-            # Stop Chrome
-            process.terminate()
-            process.wait()
+            try:
+                if INTERACTIVE:
+                    # Ask user to confirm
+                    input("\nPress Enter after verifying Chrome is visible in VNC...")
+                elif _wait_for_chrome_window():
+                    print("✅ Chrome window is showing on the VNC display")
+                else:
+                    print("⚠️  Could not detect the Chrome window (needs xdotool or xwininfo)")
+            finally:
+                # Stop Chrome; the pidfd wakes the wait as soon as it exits
+                with ProcessHandle(process.pid) as chrome:
+                    chrome.send_signal(signal.SIGTERM)
+                if not wait_for_exit(process.pid, 10.0):
+                    process.kill()
+                process.wait()
             print("✅ Chrome stopped")
             return True
         else:
@@ -119,15 +394,30 @@ def main():
         print("❌ This test is designed for Linux systems")
         return
     
-    # Run checks
+    # Each check only matters if the one before it passed
+    # (VNC -> DISPLAY -> Chrome -> launch). The Chrome probe starts right away
+    # and is killed as soon as an earlier check fails; skipped checks are None.
+    # With the version already cached for this binary there is nothing to probe.
+    binary = _chrome_binary()
+    if binary and _cached_chrome_version(*binary) is None:
+        chrome_probe = _start_probes([CHROME_PROBE])
+    else:
+        chrome_probe = []
     vnc_ok = check_vnc_status()
-    display_ok = check_display()
-    chrome_ok = check_chrome()
+    display_ok = check_display() if vnc_ok else None
+    if display_ok:
+        chrome_ok = check_chrome(_collect_probes([CHROME_PROBE], chrome_probe)[0] if chrome_probe else None)
+    else:
+        _cancel_probes(chrome_probe)
+        chrome_ok = None
+    
+    def mark(ok):
+        return '⏭️' if ok is None else '✅' if ok else '❌'
     
     print("\n📊 Test Results:")
-    print(f"  VNC Server: {'✅' if vnc_ok else '❌'}")
-    print(f"  DISPLAY: {'✅' if display_ok else '❌'}")
-    print(f"  Chrome: {'✅' if chrome_ok else '❌'}")
+    print(f"  VNC Server: {mark(vnc_ok)}")
+    print(f"  DISPLAY: {mark(display_ok)}")
+    print(f"  Chrome: {mark(chrome_ok)}")
     
     if not vnc_ok:
         print("\n🔧 To start VNC server:")
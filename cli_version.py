@@ -6,12 +6,22 @@ For running on Linux servers without GUI
 
 import sys
 import os
-import json
+import re
 import time
+import queue
 import random
+import shutil
+import atexit
+import tempfile
+import threading
+import subprocess
 import argparse
+import platform
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from datetime import datetime
-from typing import List, Dict, Optional
+from typing import Callable, List, Dict, Optional, Set, Tuple
 from pathlib import Path
 
 # Import required modules
@@ -22,44 +32,267 @@ try:
     from selenium.webdriver.support import expected_conditions as EC
     from selenium.webdriver.chrome.options import Options
     from selenium.webdriver.chrome.service import Service
-    from selenium.common.exceptions import TimeoutException, NoSuchElementException
+    from selenium.webdriver.chromium.remote_connection import ChromiumRemoteConnection
+    from selenium.common.exceptions import TimeoutException, NoSuchElementException, StaleElementReferenceException
     from webdriver_manager.chrome import ChromeDriverManager
     import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.request import ACCEPT_ENCODING
     from bs4 import BeautifulSoup
 except ImportError as e:
     print(f"Error: Missing required module - {e}")
     print("Please install requirements: pip install -r requirements.txt")
     sys.exit(1)
 
+# lxml's C parser with precompiled XPath is preferred for the requests
+# fallback; BeautifulSoup's html.parser is used when lxml is missing
+try:
+    from lxml import etree, html as lxml_html
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+
+from persistence import dumps, read_json, write_atomic
+
+
+# Where the CLI keeps its Chrome profiles (relative to the working directory)
+CHROME_DATA_DIR = "chrome-data"
+
+
+def list_profile_dirs(base_dir: str = CHROME_DATA_DIR) -> Dict[str, os.DirEntry]:
+    """List profile directories with a single directory scan"""
+    try:
+        with os.scandir(base_dir) as entries:
+            return {entry.name: entry for entry in entries if entry.is_dir(follow_symlinks=False)}
+    except FileNotFoundError:
+        return {}
+
+
+# Looked up once; the platform cannot change while the process runs
+_SYSTEM = platform.system()
+_IS_LINUX = _SYSTEM == "Linux"
+_IS_MAC = _SYSTEM == "Darwin"  # macOS
+
+# The last chromedriver webdriver-manager installed and the Chrome major
+# version it was installed for; lets later runs skip webdriver-manager's
+# online version check while Chrome has not been upgraded
+CHROMEDRIVER_PATH_FILE = Path("app/state/chromedriver_path.json")
+
+CHROME_BINARIES = ('google-chrome', 'google-chrome-stable', 'chromium', 'chromium-browser')
+
+
+@lru_cache(maxsize=1)
+def local_chrome_major() -> Optional[str]:
+    """Return the major version of the installed Chrome (e.g. "120"), or None if unknown (cached per process)"""
+    for name in CHROME_BINARIES:
+        path = shutil.which(name)
+        if not path:
+            continue
+        try:
+            output = subprocess.run([path, '--version'], capture_output=True, text=True, timeout=10).stdout
+        except (OSError, subprocess.TimeoutExpired):
+            continue
+        match = re.search(r'(\d+)\.\d+', output)
+        if match:
+            return match.group(1)
+    return None
+
+
+def cached_chromedriver_path() -> Optional[str]:
+    """Return the remembered webdriver-manager chromedriver if it still fits the installed Chrome"""
+    try:
+        cached = read_json(CHROMEDRIVER_PATH_FILE)
+    except (OSError, ValueError):
+        return None
+    path = cached.get('path')
+    if not path or not os.path.isfile(path):
+        return None
+    # Where Chrome's version cannot be read (e.g. not on PATH on Windows) the
+    # path is still tried; a failing driver triggers a fresh install anyway
+    chrome_major = local_chrome_major()
+    if chrome_major and cached.get('chrome_major') != chrome_major:
+        return None
+    return path
+
+
+def install_chromedriver() -> str:
+    """Install chromedriver with webdriver-manager and remember its path"""
+    path = ChromeDriverManager().install()
+    try:
+        CHROMEDRIVER_PATH_FILE.parent.mkdir(parents=True, exist_ok=True)
+        write_atomic(CHROMEDRIVER_PATH_FILE, dumps({'path': path, 'chrome_major': local_chrome_major()}, indent=True))
+    except OSError as e:
+        print(f"Could not remember ChromeDriver path: {e}")
+    return path
+
+
+# Enable JavaScript and improve compatibility (headless scraping/automation only)
+_COMPAT_CHROME_ARGS = (
+    "--enable-javascript",
+    "--enable-scripts",
+    "--disable-web-security",
+    "--allow-running-insecure-content",
+)
+
+# Options for better automation and stealth, used by every driver
+_COMMON_CHROME_ARGS = (
+    "--no-sandbox",
+    "--disable-dev-shm-usage",
+    "--disable-blink-features=AutomationControlled",
+    "--disable-extensions",
+    "--disable-gpu",
+    "--disable-background-timer-throttling",
+    "--disable-backgrounding-occluded-windows",
+    "--disable-renderer-backgrounding",
+    "--disable-features=TranslateUI",
+    "--disable-ipc-flooding-protection",
+    # Set user agent to avoid detection
+    "--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+)
+
+_STEALTH_PREFS = {
+    "profile.default_content_setting_values.notifications": 2,
+    "profile.default_content_settings.popups": 0,
+    "profile.managed_default_content_settings.images": 2,
+    "profile.default_content_setting_values.media_stream": 2,
+}
+
+
+def _build_chrome_options(profile_dir: str, debug_port: int = None, gui: bool = False) -> Options:
+    """
+    Build the Chrome options shared by the scraper and the automation drivers
+    
+    Args:
+        profile_dir (str): Chrome user data directory
+        debug_port (int): Remote debugging port (None for no port)
+        gui (bool): Visible browser on the VNC display (skips the compatibility switches)
+    
+    Returns:
+        Options: Chrome options ready for a driver
+    """
+    chrome_options = Options()
+    chrome_options.add_argument(f"--user-data-dir={os.path.abspath(profile_dir)}")
+    if not gui:
+        for argument in _COMPAT_CHROME_ARGS:
+            chrome_options.add_argument(argument)
+    for argument in _COMMON_CHROME_ARGS:
+        chrome_options.add_argument(argument)
+    if debug_port is not None:
+        chrome_options.add_argument(f"--remote-debugging-port={debug_port}")
+    
+    # Experimental options for stealth
+    chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
+    chrome_options.add_experimental_option('useAutomationExtension', False)
+    chrome_options.add_experimental_option("prefs", dict(_STEALTH_PREFS))
+    return chrome_options
+
+
+# Hide the usual automation fingerprints from page scripts
+_STEALTH_JS = (
+    "Object.defineProperty(navigator, 'webdriver', {get: () => undefined});"
+    "Object.defineProperty(navigator, 'plugins', {get: () => [1, 2, 3, 4, 5]});"
+    "Object.defineProperty(navigator, 'languages', {get: () => ['en-US', 'en']});"
+    "window.chrome = {runtime: {}};"
+)
+
+
+def _apply_stealth(driver):
+    """
+    Install the stealth patches with a single chromedriver call
+    
+    Registered through CDP they run before any page script on every document
+    the tab loads; without CDP they are applied to the current page only.
+    """
+    try:
+        driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": _STEALTH_JS})
+    except Exception:
+        driver.execute_script(_STEALTH_JS)
+
+
+# Resources the scraper never needs: images, video, web fonts and trackers
+_BLOCKED_URL_PATTERNS = (
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp",
+    "*.mp4", "*.webm",
+    "*.woff", "*.woff2", "*.ttf",
+    "*google-analytics*", "*doubleclick*",
+)
+
+
+def _set_resource_blocking(driver, enabled: bool):
+    """Block (or unblock) _BLOCKED_URL_PATTERNS at the network layer through CDP"""
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": list(_BLOCKED_URL_PATTERNS) if enabled else []})
+    except Exception as e:
+        print(f"Could not set resource blocking: {e}")
+
 
 class ProfileManager:
     """Class to manage Chrome profiles"""
     
+    # Parsed profiles.json per file, keyed by (mtime_ns, size) at load time,
+    # so repeated ProfileManager() instances skip re-reading an unchanged file
+    _cache: Dict[Path, Tuple[Tuple[int, int], Dict[str, Dict]]] = {}
+    
     def __init__(self):
         self.app_state_dir = Path("app/state")
         self.app_state_dir.mkdir(parents=True, exist_ok=True)
         self.profiles_file = self.app_state_dir / "profiles.json"
         self.profiles = self.load_profiles()
+        self._profile_names = None  # Cached get_all_profiles() result
+        self._dirty = False  # Unsaved last_used updates (written by flush())
+        self._saved_digest = None  # Hash of the bytes this instance last wrote
+        self._flush_registered = False
+    
+    @staticmethod
+    def _file_stamp(path: Path) -> Optional[Tuple[int, int]]:
+        """Return (mtime_ns, size) of a file, or None if it does not exist"""
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+    
+    def _remember(self, stamp: Tuple[int, int], profiles: Dict[str, Dict]):
+        """Store a copy of profiles in the class cache"""
+        key = self.profiles_file.absolute()
+        self._cache[key] = (stamp, {name: dict(profile) for name, profile in profiles.items()})
     
     def load_profiles(self) -> Dict[str, Dict]:
-        """Load saved profiles from JSON file"""
-        if self.profiles_file.exists():
-            try:
-                with open(self.profiles_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            except Exception as e:
-                print(f"Error loading profiles: {e}")
+        """Load saved profiles from JSON file (cached until the file changes)"""
+        try:
+            stamp = self._file_stamp(self.profiles_file)
+            if stamp is None:
                 return {}
-        return {}
+            cached = self._cache.get(self.profiles_file.absolute())
+            if cached is None or cached[0] != stamp:
+                profiles = read_json(self.profiles_file)
+                self._remember(stamp, profiles)
+                return profiles
+            # Each instance gets its own copy of the profile entries
+            return {name: dict(profile) for name, profile in cached[1].items()}
+        except Exception as e:
+            print(f"Error loading profiles: {e}")
+            return {}
     
     def save_profiles(self):
-        """Save profiles to JSON file"""
+        """Save profiles to JSON file (skipped when nothing changed since the last save)"""
         try:
-            with open(self.profiles_file, 'w', encoding='utf-8') as f:
-                json.dump(self.profiles, f, indent=2, ensure_ascii=False)
+            data = dumps(self.profiles, indent=True)
+            digest = hashlib.blake2b(data, digest_size=16).digest()
+            if digest != self._saved_digest:
+                write_atomic(self.profiles_file, data)
+                self._saved_digest = digest
+                self._remember(self._file_stamp(self.profiles_file), self.profiles)
+            self._dirty = False
         except Exception as e:
             print(f"Error saving profiles: {e}")
     
+    def flush(self):
+        """Write pending last_used updates"""
+        if self._dirty:
+            self.save_profiles()
+    
     def add_profile(self, profile_name: str, profile_path: str) -> bool:
         """Add a new profile"""
         if profile_name in self.profiles:
@@ -71,6 +304,7 @@ class ProfileManager:
             "created": datetime.now().isoformat(),
             "last_used": None
         }
+        self._profile_names = None
         self.save_profiles()
         return True
     
@@ -79,144 +313,357 @@ class ProfileManager:
         return self.profiles.get(profile_name)
     
     def get_all_profiles(self) -> List[str]:
-        """Get list of all profile names"""
-        return list(self.profiles.keys())
+        """Get list of all profile names (cached until a profile is added or deleted)"""
+        profile_names = self._profile_names
+        if profile_names is None:
+            profile_names = self._profile_names = list(self.profiles.keys())
+        return profile_names
     
     def update_last_used(self, profile_name: str):
-        """Update last used timestamp for profile"""
+        """Update last used timestamp for profile (saved by flush(), at the latest on exit)"""
         if profile_name in self.profiles:
             self.profiles[profile_name]["last_used"] = datetime.now().isoformat()
-            self.save_profiles()
+            self._dirty = True
+            if not self._flush_registered:
+                atexit.register(self.flush)
+                self._flush_registered = True
     
     def delete_profile(self, profile_name: str) -> bool:
         """Delete a profile"""
         if profile_name in self.profiles:
             del self.profiles[profile_name]
+            self._profile_names = None
             self.save_profiles()
             return True
         return False
 
 
+# Seconds to wait for a tweet's text to render before retrying
+TWEET_LOAD_TIMEOUT = 15
+
+# Selectors tried in order for the tweet text (matching main.py)
+_TWEET_TEXT_SELECTORS_CHROME = (
+    'div[data-testid="tweetText"]',
+    'div[lang]',
+    '.tweet-text',
+    '[data-testid="tweet"] div[lang]',
+    'article[data-testid="tweet"] div[lang]',
+    '[data-testid="tweet"] span[lang]',
+    'div[data-testid="tweet"] span',
+    'article div[lang]',
+    '[data-testid="tweetText"]',
+    '[data-testid="tweet"] [lang]',
+    '[data-testid="tweet"] div[dir="auto"]',
+    'article[data-testid="tweet"] div[dir="auto"]',
+    'div[data-testid="tweet"] div[dir="auto"]',
+    'span[data-testid="tweetText"]',
+)
+
+# Runs the selectors above inside the page and resolves with the first
+# meaningful visible text as soon as it renders (a MutationObserver re-checks
+# on every DOM change), or with null after the timeout. The whole wait is one
+# chromedriver call. Hidden elements are skipped, as element.text would
+# return an empty string for them.
+_WAIT_FOR_TWEET_TEXT_JS = """
+const [selectors, timeoutMs, done] = arguments;
+function findTweetText() {
+    for (const selector of selectors) {
+        for (const element of document.querySelectorAll(selector)) {
+            if (!element.getClientRects().length) continue;
+            const text = (element.innerText || '').trim();
+            if (text.length > 10) return text;
+        }
+    }
+    return null;
+}
+const found = findTweetText();
+if (found) {
+    done(found);
+} else {
+    let timer = null;
+    const observer = new MutationObserver(() => {
+        const text = findTweetText();
+        if (text) finish(text);
+    });
+    function finish(result) {
+        observer.disconnect();
+        clearTimeout(timer);
+        done(result);
+    }
+    timer = setTimeout(() => finish(null), timeoutMs);
+    observer.observe(document, {childList: true, subtree: true, characterData: true});
+}
+"""
+
+
+# Returns [status, js_blocked]: the HTTP status of the main document (-1 for
+# Chrome's network error page, 0 if unknown) and whether X's "JavaScript is
+# not available" page is showing. Checked inside the page so the (multi-MB)
+# page source never has to be sent over to Python
+_PAGE_CHECK_JS = """
+const nav = performance.getEntriesByType('navigation')[0];
+const status = location.protocol === 'chrome-error:' ? -1 : ((nav && nav.responseStatus) || 0);
+const root = document.documentElement;
+const text = root ? root.textContent.toLowerCase() : '';
+return [status, text.includes('javascript') && (text.includes('disabled') || text.includes('not available'))];
+"""
+
+
+def _wait_for_tweet_text(driver, timeout: float) -> Optional[str]:
+    """Wait up to timeout seconds for the tweet text to render; None if it never does"""
+    try:
+        return driver.execute_async_script(_WAIT_FOR_TWEET_TEXT_JS, list(_TWEET_TEXT_SELECTORS_CHROME), int(timeout * 1000))
+    except TimeoutException:
+        return None
+
+
+_TWEET_TEXT_SELECTORS_REQUESTS = (
+    'div[data-testid="tweetText"]',
+    'div[lang]',
+    '.tweet-text',
+    '[data-testid="tweet"] div[lang]',
+    'article[data-testid="tweet"] div[lang]',
+    '[data-testid="tweet"] span[lang]',
+    'div[data-testid="tweet"] span',
+    'article div[lang]',
+    '[data-testid="tweetText"]',
+    '[lang]',
+    'div[dir="auto"]',
+    'p',
+    'span',
+)
+
+if LXML_AVAILABLE:
+    # _TWEET_TEXT_SELECTORS_REQUESTS translated to XPath, compiled once
+    _TWEET_TEXT_XPATHS_REQUESTS = tuple(etree.XPath(xpath) for xpath in (
+        '//div[@data-testid="tweetText"]',
+        '//div[@lang]',
+        '//*[contains(concat(" ", normalize-space(@class), " "), " tweet-text ")]',
+        '//*[@data-testid="tweet"]//div[@lang]',
+        '//article[@data-testid="tweet"]//div[@lang]',
+        '//*[@data-testid="tweet"]//span[@lang]',
+        '//div[@data-testid="tweet"]//span',
+        '//article//div[@lang]',
+        '//*[@data-testid="tweetText"]',
+        '//*[@lang]',
+        '//div[@dir="auto"]',
+        '//p',
+        '//span',
+    ))
+    # Visible text only, like BeautifulSoup's get_text() (no script/style contents)
+    _VISIBLE_TEXT_XPATH = etree.XPath('.//text()[not(ancestor::script) and not(ancestor::style)]')
+
+
+_REQUEST_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.5',
+    # Every encoding urllib3 can decode here (adds br when brotli is installed)
+    'Accept-Encoding': ACCEPT_ENCODING,
+    'Connection': 'keep-alive',
+    'Upgrade-Insecure-Requests': '1',
+    'Cache-Control': 'no-cache',
+    'Pragma': 'no-cache',
+}
+
+# One keep-alive session for the requests fallback, so consecutive tweets
+# reuse the TCP/TLS connection instead of handshaking for every URL
+_SESSION = requests.Session()
+_SESSION.mount('https://', HTTPAdapter(pool_connections=32, pool_maxsize=32, max_retries=0))
+_SESSION.headers.update(_REQUEST_HEADERS)
+
+
+def _find_tweet_text_lxml(content: bytes) -> Optional[str]:
+    """Return the first meaningful text matched by the requests selectors, using lxml"""
+    if not content.strip():
+        return None
+    tree = lxml_html.fromstring(content)
+    for xpath in _TWEET_TEXT_XPATHS_REQUESTS:
+        for element in xpath(tree):
+            text = ''.join(part.strip() for part in _VISIBLE_TEXT_XPATH(element))
+            if len(text) > 10:  # Ensure we have meaningful content
+                return text
+    return None
+
+
+def _find_tweet_text_soup(content: bytes) -> Optional[str]:
+    """Return the first meaningful text matched by the requests selectors, using BeautifulSoup"""
+    soup = BeautifulSoup(content, 'html.parser')
+    for selector in _TWEET_TEXT_SELECTORS_REQUESTS:
+        for element in soup.select(selector):
+            text = element.get_text(strip=True)
+            if text and len(text) > 10:  # Ensure we have meaningful content
+                return text
+    return None
+
+
 class TweetScraper:
     """Class to scrape tweet content using Chrome profile"""
     
-    def __init__(self, profile_name: str = None):
+    # Drivers parked by cleanup(keep_alive=True), keyed by (profile, worker, use_gui, display)
+    _driver_pool: Dict[Tuple[str, int, bool, str], webdriver.Remote] = {}
+    # chromedriver services shared by every scraper, keyed by executable path
+    _driver_services: Dict[str, Service] = {}
+    # Guards _driver_services and chromedriver installs (scrape_many sets
+    # drivers up from several threads at once)
+    _driver_lock = threading.Lock()
+    _exit_hook_registered = False
+    
+    def __init__(self, profile_name: str = None, worker: int = 0):
         self.profile_name = profile_name
+        # Workers other than 0 run on their own copy of the profile (see scrape_many)
+        self.worker = worker
         self.driver = None
+        self._pool_key = None
+        self._worker_profile_dir = None  # Temporary profile copy of a worker > 0
     
-    def setup_driver(self, profile_name: str = None, use_gui: bool = False, display: str = ":1"):
-        """Setup Chrome driver with profile"""
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.cleanup()
+    
+    @classmethod
+    def _take_pooled_driver(cls, key: Tuple[str, int, bool, str]):
+        """Return a parked driver for this key if its browser is still alive"""
+        driver = cls._driver_pool.pop(key, None)
+        if driver is None:
+            return None
+        try:
+            driver.window_handles  # Round-trip to make sure the browser still answers
+            return driver
+        except Exception:
+            try:
+                driver.quit()
+            except Exception:
+                pass
+            return None
+    
+    @classmethod
+    def _register_exit_hook(cls):
+        """Make sure pooled drivers and shared services are shut down at exit"""
+        if not cls._exit_hook_registered:
+            atexit.register(cls.stop_driver_services)
+            cls._exit_hook_registered = True
+    
+    @classmethod
+    def _connect_driver(cls, driver_path: str, chrome_options: Options) -> webdriver.Remote:
+        """
+        Open a browser session on a shared chromedriver service
+        
+        chromedriver is started once per executable and every later session
+        connects to it, so only the first setup_driver() call pays for
+        starting the driver binary. The services are stopped at exit.
+        """
+        with cls._driver_lock:
+            service = cls._driver_services.get(driver_path)
+            if service is None or not service.is_connectable():
+                service = Service(driver_path)
+                service.start()
+                cls._register_exit_hook()
+                cls._driver_services[driver_path] = service
+        # The Chromium connection adds the Chrome-specific commands (CDP) to Remote
+        executor = ChromiumRemoteConnection(service.service_url, vendor_prefix="goog", browser_name="chrome")
+        return webdriver.Remote(command_executor=executor, options=chrome_options)
+    
+    @classmethod
+    def _connect_managed_driver(cls, chrome_options: Options) -> webdriver.Remote:
+        """
+        Open a browser session on webdriver-manager's chromedriver
+        
+        The remembered driver is tried first; webdriver-manager is only asked
+        (a network round-trip) when there is none or it no longer works,
+        e.g. after a Chrome update.
+        """
+        with cls._driver_lock:
+            driver_path = cached_chromedriver_path()
+        if driver_path:
+            try:
+                return cls._connect_driver(driver_path, chrome_options)
+            except Exception as e:
+                print(f"Cached ChromeDriver failed: {e}")
+        # Concurrent webdriver-manager installs would share one download path
+        with cls._driver_lock:
+            driver_path = install_chromedriver()
+        return cls._connect_driver(driver_path, chrome_options)
+    
+    @classmethod
+    def stop_driver_services(cls):
+        """Stop the shared chromedriver services (after closing pooled drivers)"""
+        cls.close_pooled_drivers()
+        while cls._driver_services:
+            _, service = cls._driver_services.popitem()
+            try:
+                service.stop()
+            except Exception as e:
+                print(f"Error stopping chromedriver: {e}")
+    
+    @classmethod
+    def close_pooled_drivers(cls):
+        """Quit every parked driver"""
+        while cls._driver_pool:
+            _, driver = cls._driver_pool.popitem()
+            try:
+                driver.quit()
+            except Exception as e:
+                print(f"Error closing pooled driver: {e}")
+    
+    def setup_driver(self, profile_name: str = None, use_gui: bool = False, display: str = ":1",
+                     block_media: bool = True):
+        """Setup Chrome driver with profile (block_media: skip images, video, fonts and trackers)"""
         if profile_name:
             self.profile_name = profile_name
             
         if not self.profile_name:
             raise ValueError("Profile name is required")
+        
+        # Reuse a browser left running by an earlier scraper for the same profile
+        self._pool_key = (self.profile_name, self.worker, use_gui, display)
+        pooled_driver = self._take_pooled_driver(self._pool_key)
+        if pooled_driver:
+            if os.name == 'posix' and use_gui:
+                os.environ["DISPLAY"] = display
+            self.driver = pooled_driver
+            _set_resource_blocking(self.driver, block_media)
+            print("Reusing running Chrome driver")
+            return True
             
         try:
-            chrome_options = Options()
-            
             # Set up user data directory - use absolute path for Linux
             if os.name == 'posix':  # Linux
                 profile_dir = os.path.expanduser(f"~/.config/chrome_profiles/{self.profile_name}")
             else:  # Windows/Other
-                profile_dir = f"chrome-data/{self.profile_name}"
+                profile_dir = f"{CHROME_DATA_DIR}/{self.profile_name}"
             
-            os.makedirs(profile_dir, exist_ok=True)
-            chrome_options.add_argument(f"--user-data-dir={os.path.abspath(profile_dir)}")
+            if self.worker:
+                # Chrome will not open one profile twice, so each extra worker
+                # runs on a fresh temporary copy of it (keeping the current
+                # login cookies); removed by remove_worker_profile()
+                if self._worker_profile_dir is None:
+                    self._worker_profile_dir = tempfile.mkdtemp(prefix=f"{self.profile_name}-worker{self.worker}-")
+                    if os.path.isdir(profile_dir):
+                        shutil.copytree(profile_dir, self._worker_profile_dir, symlinks=True, dirs_exist_ok=True,
+                                        ignore=shutil.ignore_patterns('Singleton*', 'Cache', 'Code Cache', 'GPUCache'))
+                profile_dir = self._worker_profile_dir
             
             # VNC support for Linux
-            if os.name == 'posix' and use_gui:
+            gui_mode = os.name == 'posix' and use_gui
+            if gui_mode:
                 print(f"Setting up Chrome in GUI mode for VNC display {display}")
                 os.environ["DISPLAY"] = display
                 # Don't use headless mode for VNC
-            else:
-                # Enable JavaScript and improve compatibility
-                chrome_options.add_argument("--enable-javascript")
-                chrome_options.add_argument("--enable-scripts")
-                chrome_options.add_argument("--disable-web-security")
-                chrome_options.add_argument("--allow-running-insecure-content")
-            
-            # Common options for both modes
-            chrome_options.add_argument("--no-sandbox")
-            chrome_options.add_argument("--disable-dev-shm-usage")
-            chrome_options.add_argument("--disable-blink-features=AutomationControlled")
-            chrome_options.add_argument("--disable-extensions")
-            chrome_options.add_argument("--disable-gpu")
             
             # Only set debugging port if not in GUI mode
-            if not use_gui:
-                chrome_options.add_argument("--remote-debugging-port=9222")
-            
-            # Additional options for better automation and stealth
-            chrome_options.add_argument("--disable-background-timer-throttling")
-            chrome_options.add_argument("--disable-backgrounding-occluded-windows")
-            chrome_options.add_argument("--disable-renderer-backgrounding")
-            chrome_options.add_argument("--disable-features=TranslateUI")
-            chrome_options.add_argument("--disable-ipc-flooding-protection")
-            
-            # Set user agent to avoid detection
-            chrome_options.add_argument("--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
-            
-            # Experimental options for stealth
-            chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
-            chrome_options.add_experimental_option('useAutomationExtension', False)
-            chrome_options.add_experimental_option("prefs", {
-                "profile.default_content_setting_values.notifications": 2,
-                "profile.default_content_settings.popups": 0,
-                "profile.managed_default_content_settings.images": 2,
-                "profile.default_content_setting_values.media_stream": 2,
-            })
-            
-            # Try to use system ChromeDriver on Linux
-            if os.name == 'posix':
-                try:
-                    print("Using system ChromeDriver on Linux...")
-                    service = Service('/usr/local/bin/chromedriver')
-                    self.driver = webdriver.Chrome(service=service, options=chrome_options)
-                    print("System ChromeDriver initialized successfully")
-                except Exception as e:
-                    print(f"System ChromeDriver failed: {e}")
-                    # Fallback to webdriver-manager
-                    try:
-                        print("Falling back to webdriver-manager...")
-                        service = Service(ChromeDriverManager().install())
-                        self.driver = webdriver.Chrome(service=service, options=chrome_options)
-                        print("ChromeDriver downloaded and initialized successfully")
-                    except Exception as e2:
-                        print(f"All ChromeDriver attempts failed: {e2}")
-                        return False
-            else:
-                # Non-Linux: Use webdriver-manager first
-                try:
-                    print("Attempting to download ChromeDriver...")
-                    service = Service(ChromeDriverManager().install())
-                    self.driver = webdriver.Chrome(service=service, options=chrome_options)
-                    print("ChromeDriver downloaded and initialized successfully")
-                except Exception as e:
-                    print(f"webdriver-manager failed: {e}")
-                    # Fallback: try to use system ChromeDriver
-                    try:
-                        print("Trying system ChromeDriver...")
-                        self.driver = webdriver.Chrome(options=chrome_options)
-                        print("System ChromeDriver initialized successfully")
-                    except Exception as e2:
-                        print(f"System ChromeDriver failed: {e2}")
-                        # Last resort: try without service
-                        try:
-                            print("Trying ChromeDriver without service...")
-                            self.driver = webdriver.Chrome(options=chrome_options)
-                            print("ChromeDriver initialized without service")
-                        except Exception as e3:
-                            print(f"All ChromeDriver attempts failed: {e3}")
-                            return False
+            self.driver = _make_driver(profile_dir, debug_port=None if use_gui else 9222 + self.worker, gui=gui_mode)
             
             if self.driver:
+                _set_resource_blocking(self.driver, block_media)
+                # Leave room for the in-page wait in _wait_for_tweet_text()
+                self.driver.set_script_timeout(TWEET_LOAD_TIMEOUT + 5)
+                
                 # Execute stealth scripts to avoid detection (not needed in GUI mode)
                 if not use_gui:
-                    self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-                    self.driver.execute_script("Object.defineProperty(navigator, 'plugins', {get: () => [1, 2, 3, 4, 5]})")
-                    self.driver.execute_script("Object.defineProperty(navigator, 'languages', {get: () => ['en-US', 'en']})")
-                    self.driver.execute_script("window.chrome = {runtime: {}}")
+                    _apply_stealth(self.driver)
                     print("Chrome driver initialized successfully with stealth options")
                 else:
                     print("Chrome driver initialized successfully in GUI mode")
@@ -229,6 +676,78 @@ class TweetScraper:
             print(f"Failed to setup Chrome driver: {str(e)}")
             return False
     
+    @classmethod
+    def scrape_many(cls, profile_name: str, tweet_urls: List[str], workers: int = 4,
+                    use_gui: bool = False, display: str = ":1",
+                    scrape_one: Callable[['TweetScraper', str], Optional[str]] = None,
+                    delay_range: Tuple[float, float] = None) -> List[Optional[str]]:
+        """
+        Scrape several tweets concurrently with one browser per worker
+        
+        Args:
+            profile_name (str): Chrome profile to scrape with
+            tweet_urls (List[str]): Tweets to scrape
+            workers (int): Number of browsers running side by side
+            use_gui (bool): Show the browsers on the VNC display
+            display (str): X display for GUI mode
+            scrape_one (Callable): Scrapes one URL with a given scraper
+                (default: TweetScraper.scrape_tweet_content)
+            delay_range (Tuple[float, float]): Random pause (min, max seconds) a
+                browser takes after each of its tweets; other browsers keep going
+        
+        Returns:
+            List[Optional[str]]: Content for each URL, in order (None if scraping failed)
+        """
+        workers = max(1, min(workers, len(tweet_urls)))
+        scrapers = [cls(profile_name, worker=worker) for worker in range(workers)]
+        idle = queue.Queue()
+        for scraper in scrapers:
+            idle.put(scraper)
+        
+        def scrape(tweet_url: str) -> Optional[str]:
+            scraper = idle.get()
+            try:
+                if not scraper.driver:
+                    scraper.setup_driver(use_gui=use_gui, display=display)
+                if scrape_one:
+                    return scrape_one(scraper, tweet_url)
+                return scraper.scrape_tweet_content(tweet_url)
+            except Exception as e:
+                print(f"Error scraping {tweet_url}: {e}")
+                return None
+            finally:
+                if delay_range:
+                    time.sleep(random.uniform(*delay_range))
+                idle.put(scraper)
+        
+        try:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                return list(executor.map(scrape, tweet_urls))
+        finally:
+            for scraper in scrapers:
+                scraper.cleanup()
+                scraper.remove_worker_profile()
+    
+    def scrape_many_with_requests(self, tweet_urls: List[str], workers: int = 8) -> List[Optional[str]]:
+        """
+        Scrape several tweets concurrently with the requests fallback only
+        
+        The downloads overlap on worker threads sharing the keep-alive session
+        (its pool holds up to 32 connections); parsing happens on the same
+        threads, largely inside lxml.
+        
+        Args:
+            tweet_urls (List[str]): Tweets to scrape
+            workers (int): Number of downloads in flight at once
+        
+        Returns:
+            List[Optional[str]]: Content for each URL, in order (None if scraping failed)
+        """
+        if not tweet_urls:
+            return []
+        with ThreadPoolExecutor(max_workers=max(1, min(workers, len(tweet_urls)))) as executor:
+            return list(executor.map(self._scrape_with_requests, tweet_urls))
+    
     def scrape_tweet_content(self, tweet_url: str) -> Optional[str]:
         """Scrape tweet content from URL using Chrome profile or fallback to requests"""
         # Try Chrome-based scraping first
@@ -262,73 +781,31 @@ class TweetScraper:
                 print(f"Scraping with Chrome (attempt {attempt + 1}): {tweet_url}")
                 self.driver.get(tweet_url)
                 
-                # Wait for page to load and check for JavaScript detection
-                time.sleep(2)
+                status, js_blocked = self.driver.execute_script(_PAGE_CHECK_JS)
+                
+                # A failed page load will never render the tweet; retry right
+                # away instead of waiting TWEET_LOAD_TIMEOUT for it
+                if status < 0 or status >= 400:
+                    if attempt < max_retries - 1:
+                        print(f"Attempt {attempt + 1} failed: page load failed ({'network error' if status < 0 else f'HTTP {status}'}), retrying...")
+                        continue
+                    print("Page failed to load after all attempts")
+                    return None
                 
                 # Check if we're on a JavaScript detection page
-                page_source = self.driver.page_source.lower()
-                if "javascript" in page_source and ("disabled" in page_source or "not available" in page_source):
+                if js_blocked:
                     print("Detected JavaScript detection page, waiting for redirect...")
-                    # Wait longer for potential redirect
-                    time.sleep(5)
-                    
-                    # Try to refresh the page
-                    self.driver.refresh()
-                    time.sleep(3)
-                
-                # Wait for tweet content to load with multiple possible selectors
-                tweet_found = False
-                for selector in ['[data-testid="tweet"]', 'article[data-testid="tweet"]', '[data-testid="tweetText"]']:
+                    # Give it a moment to redirect by itself, otherwise refresh
+                    original_url = self.driver.current_url
                     try:
-                        WebDriverWait(self.driver, 10).until(
-                            EC.presence_of_element_located((By.CSS_SELECTOR, selector))
+                        WebDriverWait(self.driver, 5, poll_frequency=0.25).until(
+                            lambda driver: driver.current_url != original_url
                         )
-                        tweet_found = True
-                        break
                     except TimeoutException:
-                        continue
+                        self.driver.refresh()
                 
-                if not tweet_found:
-                    print("Tweet content not found, waiting longer...")
-                    time.sleep(5)
-                
-                # Additional wait for content to fully load
-                time.sleep(3)
-                
-                # Try to find tweet text content with multiple selectors
-                tweet_text = None
-                
-                # Look for tweet text in various possible selectors (matching main.py)
-                selectors = [
-                    'div[data-testid="tweetText"]',
-                    'div[lang]',
-                    '.tweet-text',
-                    '[data-testid="tweet"] div[lang]',
-                    'article[data-testid="tweet"] div[lang]',
-                    '[data-testid="tweet"] span[lang]',
-                    'div[data-testid="tweet"] span',
-                    'article div[lang]',
-                    '[data-testid="tweetText"]',
-                    '[data-testid="tweet"] [lang]',
-                    '[data-testid="tweet"] div[dir="auto"]',
-                    'article[data-testid="tweet"] div[dir="auto"]',
-                    'div[data-testid="tweet"] div[dir="auto"]',
-                    'span[data-testid="tweetText"]'
-                ]
-                
-                for selector in selectors:
-                    try:
-                        elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                        if elements:
-                            for element in elements:
-                                text = element.text.strip()
-                                if text and len(text) > 10:  # Ensure we have meaningful content
-                                    tweet_text = text
-                                    break
-                            if tweet_text:
-                                break
-                    except Exception:
-                        continue
+                # Wait for the tweet text itself; returns as soon as it has rendered
+                tweet_text = _wait_for_tweet_text(self.driver, TWEET_LOAD_TIMEOUT)
                 
                 if tweet_text:
                     # Normalize the content to a single line
@@ -336,10 +813,9 @@ class TweetScraper:
                     print(f"Successfully scraped tweet content: {normalized_content[:100]}...")
                     return normalized_content
                 else:
-                    # If no text found, try to wait a bit more and retry
+                    # Nothing rendered within TWEET_LOAD_TIMEOUT; reload and retry
                     if attempt < max_retries - 1:
                         print(f"Attempt {attempt + 1} failed: No content found, retrying...")
-                        time.sleep(3)
                         continue
                     else:
                         print("No tweet content found after all attempts")
@@ -347,8 +823,10 @@ class TweetScraper:
                         
             except Exception as e:
                 if attempt < max_retries - 1:
+                    # Navigation errors (net::ERR_*) are raised by driver.get()
+                    # as soon as they happen, so only a short pause is needed
                     print(f"Attempt {attempt + 1} failed: {e}, retrying...")
-                    time.sleep(3)
+                    time.sleep(1)
                     continue
                 else:
                     print(f"Error scraping with Chrome: {e}")
@@ -362,18 +840,7 @@ class TweetScraper:
         for attempt in range(max_retries):
             try:
                 print(f"Scraping with requests (attempt {attempt + 1}): {tweet_url}")
-                headers = {
-                    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-                    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-                    'Accept-Language': 'en-US,en;q=0.5',
-                    'Accept-Encoding': 'gzip, deflate',
-                    'Connection': 'keep-alive',
-                    'Upgrade-Insecure-Requests': '1',
-                    'Cache-Control': 'no-cache',
-                    'Pragma': 'no-cache',
-                }
-                
-                response = requests.get(tweet_url, headers=headers, timeout=15)
+                response = _SESSION.get(tweet_url, timeout=15)
                 response.raise_for_status()
                 
                 # Check if we got a JavaScript detection page
@@ -388,38 +855,11 @@ class TweetScraper:
                         print("All attempts failed: X (Twitter) requires JavaScript for content access")
                         return None
                 
-                soup = BeautifulSoup(response.content, 'html.parser')
-                
-                # Try to find tweet text content
-                tweet_text = None
-                
                 # Look for tweet text in various possible selectors (matching main.py)
-                selectors = [
-                    'div[data-testid="tweetText"]',
-                    'div[lang]',
-                    '.tweet-text',
-                    '[data-testid="tweet"] div[lang]',
-                    'article[data-testid="tweet"] div[lang]',
-                    '[data-testid="tweet"] span[lang]',
-                    'div[data-testid="tweet"] span',
-                    'article div[lang]',
-                    '[data-testid="tweetText"]',
-                    '[lang]',
-                    'div[dir="auto"]',
-                    'p',
-                    'span'
-                ]
-                
-                for selector in selectors:
-                    elements = soup.select(selector)
-                    if elements:
-                        for element in elements:
-                            text = element.get_text(strip=True)
-                            if text and len(text) > 10:  # Ensure we have meaningful content
-                                tweet_text = text
-                                break
-                        if tweet_text:
-                            break
+                if LXML_AVAILABLE:
+                    tweet_text = _find_tweet_text_lxml(response.content)
+                else:
+                    tweet_text = _find_tweet_text_soup(response.content)
                 
                 if tweet_text:
                     # Normalize the content to a single line
@@ -449,16 +889,208 @@ class TweetScraper:
         """Normalize tweet content to single line"""
         if not content:
             return ""
-        # Split by any whitespace and rejoin with single spaces
+        # Split by any whitespace and rejoin with single spaces (str.split()
+        # runs in C and measures ~4x faster than re.sub(r'\s+', ' ', ...))
         return ' '.join(content.split())
     
-    def cleanup(self):
-        """Clean up resources"""
-        if self.driver:
+    def cleanup(self, keep_alive: bool = False):
+        """
+        Clean up resources
+        
+        Args:
+            keep_alive (bool): Park the driver so the next setup_driver() call
+                for the same profile reuses it instead of launching Chrome again
+        """
+        if not self.driver:
+            return
+        if keep_alive and self._pool_key and self._pool_key not in self._driver_pool:
+            self._register_exit_hook()
+            self._driver_pool[self._pool_key] = self.driver
+        else:
             try:
                 self.driver.quit()
             except Exception as e:
                 print(f"Error closing driver: {e}")
+        self.driver = None
+    
+    def remove_worker_profile(self):
+        """Delete the temporary profile copy of a worker (after cleanup())"""
+        if self._worker_profile_dir:
+            shutil.rmtree(self._worker_profile_dir, ignore_errors=True)
+            self._worker_profile_dir = None
+
+
+# Profile directories already created by this process
+_created_dirs: Set[str] = set()
+
+
+def _ensure_dir(path: str):
+    """os.makedirs(path, exist_ok=True), done at most once per path and process"""
+    if path not in _created_dirs:
+        os.makedirs(path, exist_ok=True)
+        _created_dirs.add(path)
+
+
+def _make_driver(profile_dir: str, *, debug_port: Optional[int], gui: bool = False) -> Optional[webdriver.Remote]:
+    """
+    Start Chrome on a profile directory, trying every way of getting a chromedriver
+    
+    Shared by TweetScraper and TwitterAutomation. Sessions run on the shared
+    chromedriver services of TweetScraper._connect_driver().
+    
+    Args:
+        profile_dir (str): Chrome user data directory (created if missing)
+        debug_port (Optional[int]): Remote debugging port (None for no port)
+        gui (bool): Visible browser on the VNC display
+    
+    Returns:
+        Optional[webdriver.Remote]: The driver, or None if every attempt failed
+    """
+    _ensure_dir(profile_dir)
+    chrome_options = _build_chrome_options(profile_dir, debug_port=debug_port, gui=gui)
+    
+    # Try to use system ChromeDriver on Linux
+    if os.name == 'posix':
+        try:
+            print("Using system ChromeDriver on Linux...")
+            driver = TweetScraper._connect_driver('/usr/local/bin/chromedriver', chrome_options)
+            print("System ChromeDriver initialized successfully")
+            return driver
+        except Exception as e:
+            print(f"System ChromeDriver failed: {e}")
+    
+    # Then webdriver-manager
+    try:
+        print("Attempting to download ChromeDriver...")
+        driver = TweetScraper._connect_managed_driver(chrome_options)
+        print("ChromeDriver downloaded and initialized successfully")
+        return driver
+    except Exception as e:
+        print(f"webdriver-manager failed: {e}")
+    # Fallback: let Selenium find a chromedriver itself
+    try:
+        print("Trying system ChromeDriver...")
+        driver = webdriver.Chrome(options=chrome_options)
+        print("System ChromeDriver initialized successfully")
+        return driver
+    except Exception as e:
+        print(f"All ChromeDriver attempts failed: {e}")
+        return None
+
+
+# Wait conditions for the automation, built once; expected_conditions
+# predicates hold no state, so every wait can share them
+_TWEET_PRESENT = EC.presence_of_element_located((By.CSS_SELECTOR, '[data-testid="tweet"]'))
+_LIKE_CLICKABLE = EC.element_to_be_clickable((By.CSS_SELECTOR, '[data-testid="like"]'))
+_RETWEET_CLICKABLE = EC.element_to_be_clickable((By.CSS_SELECTOR, '[data-testid="retweet"]'))
+_RETWEET_CONFIRM_CLICKABLE = EC.element_to_be_clickable((By.CSS_SELECTOR, '[data-testid="retweetConfirm"]'))
+_REPLY_CLICKABLE = EC.element_to_be_clickable((By.CSS_SELECTOR, '[data-testid="reply"]'))
+_REPLY_TEXTAREA_CLICKABLE = EC.element_to_be_clickable((By.CSS_SELECTOR, '[data-testid="tweetTextarea_0"]'))
+_REPLY_SUBMIT_CLICKABLE = EC.element_to_be_clickable((By.CSS_SELECTOR, '[data-testid="tweetButton"]'))
+_TOAST_LOCATOR = (By.CSS_SELECTOR, '[data-testid="toast"]')
+
+# Viewport centres of the tweet's action buttons (null where a button is
+# missing or disabled), scrolling the action bar into view first
+_ACTION_BUTTON_CENTERS_JS = """
+const centers = {};
+let scrolled = false;
+for (const testId of arguments[0]) {
+    const button = document.querySelector(`[data-testid="${testId}"]`);
+    if (!button || button.disabled || button.getAttribute('aria-disabled') === 'true') {
+        centers[testId] = null;
+        continue;
+    }
+    if (!scrolled) {
+        button.scrollIntoView({block: 'center'});
+        scrolled = true;
+    }
+    const rect = button.getBoundingClientRect();
+    centers[testId] = [rect.left + rect.width / 2, rect.top + rect.height / 2];
+}
+return centers;
+"""
+
+
+def _click_at(driver, center: Optional[List[float]]) -> bool:
+    """
+    Click a viewport position with CDP mouse events
+    
+    Returns:
+        bool: False if there is no position or CDP is unavailable (the caller
+            then falls back to finding and clicking the element)
+    """
+    if not center:
+        return False
+    x, y = center
+    try:
+        for event_type in ("mousePressed", "mouseReleased"):
+            driver.execute_cdp_cmd("Input.dispatchMouseEvent", {
+                "type": event_type, "x": x, "y": y, "button": "left", "clickCount": 1
+            })
+        return True
+    except Exception:
+        return False
+
+
+class _LogWriter:
+    """
+    Appends log lines to files from a background thread
+    
+    Files stay open (buffered) between lines and are flushed whenever the
+    queue runs empty, so a burst of lines costs one write() per file instead
+    of an open/write/close per line. Pending lines are written at exit.
+    """
+    
+    def __init__(self):
+        self._queue = queue.Queue()
+        self._thread = None
+        self._lock = threading.Lock()
+    
+    def write(self, filename: str, line: bytes):
+        """Queue a complete line (including its newline) for filename"""
+        if self._thread is None:
+            with self._lock:
+                if self._thread is None:
+                    self._thread = threading.Thread(target=self._run, name="log-writer", daemon=True)
+                    self._thread.start()
+                    atexit.register(self.close)
+        self._queue.put((filename, line))
+    
+    def _run(self):
+        files = {}
+        while True:
+            item = self._queue.get()
+            if item is not None:
+                filename, line = item
+                try:
+                    f = files.get(filename)
+                    if f is None:
+                        f = files[filename] = open(filename, 'ab', buffering=65536)
+                    f.write(line)
+                except OSError as e:
+                    print(f"Error writing to {filename}: {e}")
+            if item is None or self._queue.empty():
+                for filename, f in files.items():
+                    try:
+                        f.flush()
+                    except OSError as e:
+                        print(f"Error writing to {filename}: {e}")
+            if item is None:
+                for f in files.values():
+                    try:
+                        f.close()
+                    except OSError:
+                        pass
+                return
+    
+    def close(self):
+        """Write everything queued so far and stop the writer thread"""
+        if self._thread is not None:
+            self._queue.put(None)
+            self._thread.join(timeout=5)
+
+
+_LOG_WRITER = _LogWriter()
 
 
 class TwitterAutomation:
@@ -471,76 +1103,13 @@ class TwitterAutomation:
     def setup_driver(self):
         """Setup Chrome driver with profile"""
         try:
-            chrome_options = Options()
-            
             # Set up user data directory
-            profile_dir = f"chrome-data/{self.profile_name}"
-            os.makedirs(profile_dir, exist_ok=True)
-            chrome_options.add_argument(f"--user-data-dir={os.path.abspath(profile_dir)}")
-            
-            # Enable JavaScript and improve compatibility
-            chrome_options.add_argument("--enable-javascript")
-            chrome_options.add_argument("--enable-scripts")
-            chrome_options.add_argument("--disable-web-security")
-            chrome_options.add_argument("--allow-running-insecure-content")
-            
-            # Additional options for better automation and stealth
-            chrome_options.add_argument("--no-sandbox")
-            chrome_options.add_argument("--disable-dev-shm-usage")
-            chrome_options.add_argument("--disable-blink-features=AutomationControlled")
-            chrome_options.add_argument("--disable-extensions")
-            chrome_options.add_argument("--disable-gpu")
-            chrome_options.add_argument("--remote-debugging-port=9223")
-            chrome_options.add_argument("--disable-background-timer-throttling")
-            chrome_options.add_argument("--disable-backgrounding-occluded-windows")
-            chrome_options.add_argument("--disable-renderer-backgrounding")
-            chrome_options.add_argument("--disable-features=TranslateUI")
-            chrome_options.add_argument("--disable-ipc-flooding-protection")
-            
-            # Set user agent to avoid detection
-            chrome_options.add_argument("--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
-            
-            # Experimental options for stealth
-            chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
-            chrome_options.add_experimental_option('useAutomationExtension', False)
-            chrome_options.add_experimental_option("prefs", {
-                "profile.default_content_setting_values.notifications": 2,
-                "profile.default_content_settings.popups": 0,
-                "profile.managed_default_content_settings.images": 2,
-                "profile.default_content_setting_values.media_stream": 2,
-            })
-            
-            # Try to use webdriver-manager to get the correct ChromeDriver
-            try:
-                from webdriver_manager.chrome import ChromeDriverManager
-                print("Attempting to download ChromeDriver...")
-                service = Service(ChromeDriverManager().install())
-                self.driver = webdriver.Chrome(service=service, options=chrome_options)
-                print("ChromeDriver downloaded and initialized successfully")
-            except Exception as e:
-                print(f"webdriver-manager failed: {e}")
-                # Fallback: try to use system ChromeDriver
-                try:
-                    print("Trying system ChromeDriver...")
-                    self.driver = webdriver.Chrome(options=chrome_options)
-                    print("System ChromeDriver initialized successfully")
-                except Exception as e2:
-                    print(f"System ChromeDriver failed: {e2}")
-                    # Last resort: try without service
-                    try:
-                        print("Trying ChromeDriver without service...")
-                        self.driver = webdriver.Chrome(options=chrome_options)
-                        print("ChromeDriver initialized without service")
-                    except Exception as e3:
-                        print(f"All ChromeDriver attempts failed: {e3}")
-                        return False
+            profile_dir = f"{CHROME_DATA_DIR}/{self.profile_name}"
+            self.driver = _make_driver(profile_dir, debug_port=9223)
             
             if self.driver:
                 # Execute stealth scripts to avoid detection
-                self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-                self.driver.execute_script("Object.defineProperty(navigator, 'plugins', {get: () => [1, 2, 3, 4, 5]})")
-                self.driver.execute_script("Object.defineProperty(navigator, 'languages', {get: () => ['en-US', 'en']})")
-                self.driver.execute_script("window.chrome = {runtime: {}}")
+                _apply_stealth(self.driver)
                 print("Chrome driver initialized successfully with stealth options")
                 return True
             else:
@@ -551,29 +1120,36 @@ class TwitterAutomation:
             print(f"Error setting up Chrome driver: {e}")
             return False
     
-    def process_tweet(self, tweet_url: str, reply_comment: str, actions: Dict[str, bool], max_retries: int = 3) -> bool:
-        """Process a single tweet with selected actions and retries"""
+    def process_tweet(self, tweet_url: str, reply_comment: str, actions: Dict[str, bool], max_retries: int = 3,
+                      preloaded: bool = False) -> bool:
+        """Process a single tweet with selected actions and retries (preloaded: see preload_tweet)"""
         for attempt in range(max_retries):
             try:
-                self.driver.get(tweet_url)
+                # Retries always reload the page
+                if attempt or not preloaded:
+                    self.driver.get(tweet_url)
                 
                 # Wait for page to load
-                WebDriverWait(self.driver, 10).until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, '[data-testid="tweet"]'))
-                )
+                WebDriverWait(self.driver, 10).until(_TWEET_PRESENT)
+                
+                # Locate every requested action button with one script call
+                wanted = [action for action in ('like', 'retweet', 'reply') if actions.get(action, False)]
+                if 'reply' in wanted and not reply_comment:
+                    wanted.remove('reply')
+                centers = self.driver.execute_script(_ACTION_BUTTON_CENTERS_JS, wanted) if wanted else {}
                 
                 # Perform actions based on checkboxes
                 success = True
-                if actions.get('like', False):
-                    if not self.like_tweet():
+                if 'like' in wanted:
+                    if not self.like_tweet(centers.get('like')):
                         success = False
                         
-                if actions.get('retweet', False):
-                    if not self.retweet_tweet():
+                if 'retweet' in wanted:
+                    if not self.retweet_tweet(centers.get('retweet')):
                         success = False
                         
-                if actions.get('reply', False) and reply_comment:
-                    if not self.reply_to_tweet(reply_comment):
+                if 'reply' in wanted:
+                    if not self.reply_to_tweet(reply_comment, centers.get('reply')):
                         success = False
                 
                 if success:
@@ -596,13 +1172,21 @@ class TwitterAutomation:
         
         return False
     
-    def like_tweet(self):
-        """Like the current tweet"""
+    def preload_tweet(self, tweet_url: str) -> bool:
+        """Open a tweet ahead of process_tweet(..., preloaded=True); False if loading failed"""
         try:
-            like_button = WebDriverWait(self.driver, 5).until(
-                EC.element_to_be_clickable((By.CSS_SELECTOR, '[data-testid="like"]'))
-            )
-            like_button.click()
+            self.driver.get(tweet_url)
+            return True
+        except Exception as e:
+            print(f"Preloading next tweet failed: {e}")
+            return False
+    
+    def like_tweet(self, center: Optional[List[float]] = None):
+        """Like the current tweet (center: button position from process_tweet)"""
+        try:
+            if not _click_at(self.driver, center):
+                like_button = WebDriverWait(self.driver, 5).until(_LIKE_CLICKABLE)
+                like_button.click()
             print("✓ Liked tweet")
             time.sleep(1)
             return True
@@ -610,18 +1194,15 @@ class TwitterAutomation:
             print(f"Failed to like tweet: {str(e)}")
             return False
     
-    def retweet_tweet(self):
-        """Retweet the current tweet"""
+    def retweet_tweet(self, center: Optional[List[float]] = None):
+        """Retweet the current tweet (center: button position from process_tweet)"""
         try:
-            retweet_button = WebDriverWait(self.driver, 5).until(
-                EC.element_to_be_clickable((By.CSS_SELECTOR, '[data-testid="retweet"]'))
-            )
-            retweet_button.click()
+            if not _click_at(self.driver, center):
+                retweet_button = WebDriverWait(self.driver, 5).until(_RETWEET_CLICKABLE)
+                retweet_button.click()
             
             # Click the retweet confirm button
-            confirm_button = WebDriverWait(self.driver, 3).until(
-                EC.element_to_be_clickable((By.CSS_SELECTOR, '[data-testid="retweetConfirm"]'))
-            )
+            confirm_button = WebDriverWait(self.driver, 3).until(_RETWEET_CONFIRM_CLICKABLE)
             confirm_button.click()
             
             print("✓ Retweeted")
@@ -631,39 +1212,46 @@ class TwitterAutomation:
             print(f"Failed to retweet: {str(e)}")
             return False
     
-    def reply_to_tweet(self, comment: str):
-        """Reply to the current tweet"""
+    def reply_to_tweet(self, comment: str, center: Optional[List[float]] = None):
+        """Reply to the current tweet (center: button position from process_tweet)"""
         try:
-            reply_button = WebDriverWait(self.driver, 5).until(
-                EC.element_to_be_clickable((By.CSS_SELECTOR, '[data-testid="reply"]'))
-            )
-            reply_button.click()
+            if not _click_at(self.driver, center):
+                reply_button = WebDriverWait(self.driver, 5).until(_REPLY_CLICKABLE)
+                reply_button.click()
             
             # Find and fill the reply text area
-            reply_textarea = WebDriverWait(self.driver, 5).until(
-                EC.element_to_be_clickable((By.CSS_SELECTOR, '[data-testid="tweetTextarea_0"]'))
-            )
+            reply_textarea = WebDriverWait(self.driver, 5).until(_REPLY_TEXTAREA_CLICKABLE)
             reply_textarea.clear()
             reply_textarea.send_keys(comment)
             
             # Click reply button
-            reply_submit = WebDriverWait(self.driver, 5).until(
-                EC.element_to_be_clickable((By.CSS_SELECTOR, '[data-testid="tweetButton"]'))
-            )
+            reply_submit = WebDriverWait(self.driver, 5).until(_REPLY_SUBMIT_CLICKABLE)
             reply_submit.click()
             
+            # Done once X shows its toast or the composer closes / empties
+            def reply_sent(driver):
+                if driver.find_elements(*_TOAST_LOCATOR):
+                    return True
+                try:
+                    return reply_textarea.text == ""
+                except StaleElementReferenceException:
+                    return True
+            
+            try:
+                WebDriverWait(self.driver, 5, poll_frequency=0.2).until(reply_sent)
+            except TimeoutException:
+                print("⚠️ Reply not confirmed yet, continuing")
+            
             print(f"✓ Replied: {comment[:50]}...")
-            time.sleep(2)
             return True
         except Exception as e:
             print(f"Failed to reply: {str(e)}")
             return False
     
     def log_to_file(self, filename: str, message: str):
-        """Log message to file with timestamp"""
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        with open(filename, 'a', encoding='utf-8') as f:
-            f.write(f"[{timestamp}] {message}\n")
+        """Log message to file with timestamp (written in the background by _LOG_WRITER)"""
+        timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
+        _LOG_WRITER.write(filename, f"[{timestamp}] {message}\n".encode('utf-8'))
     
     def cleanup(self):
         """Clean up resources"""
@@ -674,6 +1262,58 @@ class TwitterAutomation:
                 print(f"Error closing driver: {e}")
 
 
+# A line's content under universal newlines (\n, \r\n or \r endings)
+_LINE_RE = re.compile(r'[^\r\n]+')
+
+
+def _read_lines(path: str) -> List[str]:
+    """
+    Read the non-blank lines of a text file, stripped of surrounding whitespace
+    
+    The file is read and decoded in one go and split by a compiled regex,
+    instead of iterating it line by line in Python.
+    """
+    with open(path, 'rb') as f:
+        text = f.read().decode('utf-8')
+    return [line for line in map(str.strip, _LINE_RE.findall(text)) if line]
+
+
+# Basic Chrome preferences and local state for new profiles, serialized
+# ahead of time; create_profile() fills in the JSON-encoded name and
+# creation time
+_PREFS_TEMPLATE = (
+    b'{"profile":{"name":%s,"created":%s},'
+    b'"browser":{"window_placement":{"maximized":true}},'
+    b'"session":{"restore_on_startup":4}}'
+)
+_LOCAL_STATE_TEMPLATE = (
+    b'{"browser":{"profile":{"name":%s}},'
+    b'"user_experience_metrics":{"stability":{"exited_cleanly":true}}}'
+)
+
+
+# Switches for a manually used profile browser (launch_profile_browser)
+_LAUNCH_CHROME_ARGS = (
+    "--no-first-run",
+    "--no-default-browser-check",
+    "--disable-default-apps",
+    "--disable-popup-blocking",
+    "--disable-notifications",
+    "--start-maximized",
+    "--disable-web-security",
+    "--allow-running-insecure-content",
+    "--disable-features=TranslateUI",
+    "--disable-ipc-flooding-protection",
+    "--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+)
+
+# Added when the browser goes to the VNC display
+_LAUNCH_VNC_CHROME_ARGS = (
+    "--disable-gpu-sandbox",
+    "--disable-software-rasterizer",
+)
+
+
 class TwitterAutomationCLI:
     """Main CLI class for Twitter automation"""
     
@@ -699,17 +1339,11 @@ class TwitterAutomationCLI:
             print("Error: Profile name is required")
             return False
         
-        profile_path = f"chrome-data/{profile_name}"
+        profile_path = f"{CHROME_DATA_DIR}/{profile_name}"
+        profile_abs = os.path.abspath(profile_path)
         
         # Create the full Chrome profile directory structure
         try:
-            import os
-            import json
-            from datetime import datetime
-            
-            # Create main profile directory
-            os.makedirs(profile_path, exist_ok=True)
-            
             # Create Chrome profile subdirectories
             chrome_dirs = [
                 "Default",
@@ -734,59 +1368,35 @@ class TwitterAutomationCLI:
                 "GrShaderCache",
                 "ShaderCache",
                 "GPUCache",
-                "Local State",
-                "Preferences",
-                "Secure Preferences",
-                "Web Data",
-                "Web Data-journal"
             ]
             
-            for dir_path in chrome_dirs:
-                full_path = os.path.join(profile_path, dir_path)
-                if dir_path.endswith('/'):
-                    os.makedirs(full_path, exist_ok=True)
-                else:
-                    # Create directory for files
-                    os.makedirs(os.path.dirname(full_path), exist_ok=True)
-                    # Create empty files for important Chrome files
-                    if any(file in dir_path for file in ['Local State', 'Preferences', 'Secure Preferences', 'Web Data']):
-                        if not os.path.exists(full_path):
-                            with open(full_path, 'w') as f:
-                                if 'Preferences' in dir_path:
-                                    # Basic Chrome preferences
-                                    prefs = {
-                                        "profile": {
-                                            "name": profile_name,
-                                            "created": datetime.now().isoformat()
-                                        },
-                                        "browser": {
-                                            "window_placement": {
-                                                "maximized": True
-                                            }
-                                        },
-                                        "session": {
-                                            "restore_on_startup": 4
-                                        }
-                                    }
-                                    json.dump(prefs, f, indent=2)
-                                elif 'Local State' in dir_path:
-                                    # Basic local state
-                                    local_state = {
-                                        "browser": {
-                                            "profile": {
-                                                "name": profile_name
-                                            }
-                                        },
-                                        "user_experience_metrics": {
-                                            "stability": {
-                                                "exited_cleanly": True
-                                            }
-                                        }
-                                    }
-                                    json.dump(local_state, f, indent=2)
-                                else:
-                                    # Empty file for other important files
-                                    f.write("")
+            # Chrome creates the leaf entries itself; only their parent
+            # directories are made here, each once (makedirs adds the
+            # profile directory and other missing parents)
+            parent_dirs = {os.path.dirname(os.path.join(profile_path, dir_path)) for dir_path in chrome_dirs}
+            for dir_path in sorted(parent_dirs):
+                os.makedirs(dir_path, exist_ok=True)
+            
+            name_json = dumps(profile_name)
+            prefs_data = _PREFS_TEMPLATE % (name_json, dumps(datetime.now().isoformat()))
+            # Important Chrome files (empty where there is no useful default)
+            chrome_files = {
+                "Local State": _LOCAL_STATE_TEMPLATE % name_json,
+                "Preferences": prefs_data,
+                "Secure Preferences": prefs_data,
+                "Web Data": b"",
+                "Web Data-journal": b"",
+            }
+            for file_name, data in chrome_files.items():
+                # O_EXCL leaves files of an existing profile untouched
+                try:
+                    fd = os.open(os.path.join(profile_path, file_name), os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+                except FileExistsError:
+                    continue
+                try:
+                    os.write(fd, data)
+                finally:
+                    os.close(fd)
             
             # Create a profile info file
             profile_info = {
@@ -794,16 +1404,16 @@ class TwitterAutomationCLI:
                 "created": datetime.now().isoformat(),
                 "version": "1.0",
                 "description": f"Chrome profile for {profile_name}",
-                "path": os.path.abspath(profile_path)
+                "path": profile_abs
             }
             
-            with open(os.path.join(profile_path, "profile_info.json"), 'w') as f:
-                json.dump(profile_info, f, indent=2)
+            with open(os.path.join(profile_path, "profile_info.json"), 'wb') as f:
+                f.write(dumps(profile_info, indent=True))
             
             # Add to profile manager
             if self.profile_manager.add_profile(profile_name, profile_path):
                 print(f"✅ Profile '{profile_name}' created successfully")
-                print(f"📁 Profile directory: {os.path.abspath(profile_path)}")
+                print(f"📁 Profile directory: {profile_abs}")
                 print(f"🎯 To launch this profile in VNC:")
                 print(f"   ./launch_chrome_vnc.sh {profile_name}")
                 print(f"   or")
@@ -825,14 +1435,16 @@ class TwitterAutomationCLI:
         
         if self.profile_manager.delete_profile(profile_name):
             # Also delete the profile directory
-            profile_dir = f"chrome-data/{profile_name}"
-            if os.path.exists(profile_dir):
-                import shutil
-                try:
-                    shutil.rmtree(profile_dir)
-                    print(f"Profile directory '{profile_dir}' deleted")
-                except Exception as e:
-                    print(f"Warning: Could not delete profile directory: {e}")
+            # shutil.rmtree already walks with scandir and dir_fd-relative
+            # unlinks on Linux; a missing directory is simply skipped
+            profile_dir = f"{CHROME_DATA_DIR}/{profile_name}"
+            try:
+                shutil.rmtree(profile_dir)
+                print(f"Profile directory '{profile_dir}' deleted")
+            except FileNotFoundError:
+                pass
+            except Exception as e:
+                print(f"Warning: Could not delete profile directory: {e}")
             
             print(f"Profile '{profile_name}' deleted successfully")
             return True
@@ -846,19 +1458,19 @@ class TwitterAutomationCLI:
             print("Error: Profile name is required")
             return False
         
-        profile_dir = f"chrome-data/{profile_name}"
+        profile_dir = f"{CHROME_DATA_DIR}/{profile_name}"
         if not os.path.exists(profile_dir):
             print(f"Error: Profile directory '{profile_dir}' not found")
             print(f"Please create the profile first: ./run_cli.sh --create-profile {profile_name}")
             return False
+        profile_abs = os.path.abspath(profile_dir)
         
         try:
             import subprocess
-            import platform
             
             # Check if VNC is running (Linux only)
             vnc_running = False
-            if platform.system() == "Linux":
+            if _IS_LINUX:
                 try:
                     result = subprocess.run(['pgrep', '-f', 'vncserver.*:1'], capture_output=True, text=True)
                     vnc_running = result.returncode == 0
@@ -866,57 +1478,40 @@ class TwitterAutomationCLI:
                     pass
             
             # Chrome command for different platforms
-            if platform.system() == "Linux":
+            if _IS_LINUX:
                 chrome_cmd = "google-chrome"
-            elif platform.system() == "Darwin":  # macOS
+            elif _IS_MAC:
                 chrome_cmd = "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome"
             else:  # Windows
                 chrome_cmd = "chrome"
             
             # Set up Chrome options for VNC
-            chrome_options = [
-                chrome_cmd,
-                f"--user-data-dir={os.path.abspath(profile_dir)}",
-                "--no-first-run",
-                "--no-default-browser-check",
-                "--disable-default-apps",
-                "--disable-popup-blocking",
-                "--disable-notifications",
-                "--start-maximized",
-                "--disable-web-security",
-                "--allow-running-insecure-content",
-                "--disable-features=TranslateUI",
-                "--disable-ipc-flooding-protection",
-                "--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-            ]
+            chrome_options = [chrome_cmd, f"--user-data-dir={profile_abs}", *_LAUNCH_CHROME_ARGS]
             
             # Add VNC-specific options if VNC is running
-            if vnc_running and platform.system() == "Linux":
+            if vnc_running and _IS_LINUX:
                 os.environ["DISPLAY"] = ":1"
                 print(f"🖥️  VNC detected - launching Chrome in GUI mode on display :1")
-                chrome_options.extend([
-                    "--disable-gpu-sandbox",
-                    "--disable-software-rasterizer"
-                ])
-            elif platform.system() == "Linux":
+                chrome_options.extend(_LAUNCH_VNC_CHROME_ARGS)
+            elif _IS_LINUX:
                 print(f"⚠️  VNC not detected - launching Chrome in headless mode")
                 chrome_options.append("--headless")
             
             # Launch Chrome
             print(f"🚀 Launching Chrome with profile: {profile_name}")
-            print(f"📁 Profile directory: {os.path.abspath(profile_dir)}")
+            print(f"📁 Profile directory: {profile_abs}")
             
             # Launch in background
             process = subprocess.Popen(
                 chrome_options,
                 stdout=subprocess.DEVNULL,
                 stderr=subprocess.DEVNULL,
-                preexec_fn=os.setsid if platform.system() == "Linux" else None
+                start_new_session=_IS_LINUX
             )
             
             print(f"✅ Chrome launched successfully with PID: {process.pid}")
             
-            if vnc_running and platform.system() == "Linux":
+            if vnc_running and _IS_LINUX:
                 print(f"🎯 Chrome should now be visible in your VNC viewer")
                 # Get server IP for VNC connection
                 try:
@@ -938,8 +1533,9 @@ class TwitterAutomationCLI:
             print(f"Error launching Chrome browser: {e}")
             return False
     
-    def scrape_tweets(self, profile_name: str, tweet_links_file: str, output_file: str = "scraped_tweets.txt", max_retries: int = 3):
-        """Scrape tweets from file"""
+    def scrape_tweets(self, profile_name: str, tweet_links_file: str, output_file: str = "scraped_tweets.txt", max_retries: int = 3,
+                      workers: int = 1):
+        """Scrape tweets from file (workers > 1 scrapes with that many browsers in parallel)"""
         if not profile_name:
             print("Error: Profile name is required")
             return False
@@ -949,8 +1545,7 @@ class TwitterAutomationCLI:
             return False
         
         # Read tweet links
-        with open(tweet_links_file, 'r', encoding='utf-8') as f:
-            tweet_links = [line.strip() for line in f if line.strip()]
+        tweet_links = _read_lines(tweet_links_file)
         
         if not tweet_links:
             print("Error: No tweet links found in file")
@@ -958,45 +1553,71 @@ class TwitterAutomationCLI:
         
         print(f"Found {len(tweet_links)} tweet links to scrape")
         
-        # Initialize scraper
-        scraper = TweetScraper(profile_name)
-        chrome_available = scraper.setup_driver()
-        
-        if chrome_available:
-            print("Chrome driver initialized successfully")
-        else:
-            print("Chrome driver failed - using fallback requests-based scraping")
-        
-        # Scrape tweets
-        scraped_content = []
+        scraped_count = 0
         failed_links = []
         
-        for i, link in enumerate(tweet_links, 1):
-            print(f"Scraping tweet {i}/{len(tweet_links)}: {link}")
-            
-            # Try scraping with retries
-            content = self._scrape_with_retries(scraper, link, max_retries)
-            
-            if content:
-                scraped_content.append(content)
-                print(f"✓ Successfully scraped tweet {i}")
-            else:
-                failed_links.append(link)
-                print(f"✗ Failed to scrape tweet {i}")
-            
-            # Random delay between tweets
-            if i < len(tweet_links):
-                delay = random.randint(3, 5)
-                print(f"Waiting {delay} seconds...")
-                time.sleep(delay)
-        
-        # Save scraped content
-        with open(output_file, 'w', encoding='utf-8') as f:
-            for content in scraped_content:
-                f.write(f"{content}\n")
+        # Results go straight into a buffered temporary file (in link order)
+        # which replaces output_file only once scraping has finished, so a
+        # failed or interrupted run leaves the previous results intact
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(output_file)),
+                                        prefix=".tmp-", suffix=os.path.basename(output_file))
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8', buffering=1 << 20) as out:
+                if workers > 1:
+                    print(f"Scraping with {workers} browsers in parallel")
+                    # Each browser pauses 3-5s after its own tweets, like the serial loop
+                    results = TweetScraper.scrape_many(
+                        profile_name, tweet_links, workers,
+                        scrape_one=lambda scraper, link: self._scrape_with_retries(scraper, link, max_retries),
+                        delay_range=(3, 5)
+                    )
+                    for i, (link, content) in enumerate(zip(tweet_links, results), 1):
+                        if content and content.strip():
+                            out.write(f"{content}\n")
+                            scraped_count += 1
+                            print(f"✓ Successfully scraped tweet {i}")
+                        else:
+                            failed_links.append(link)
+                            print(f"✗ Failed to scrape tweet {i}")
+                else:
+                    # One scraper (and one browser) serves every link; closed when done
+                    with TweetScraper(profile_name) as scraper:
+                        chrome_available = scraper.setup_driver()
+                    
+                        if chrome_available:
+                            print("Chrome driver initialized successfully")
+                        else:
+                            print("Chrome driver failed - using fallback requests-based scraping")
+                    
+                        for i, link in enumerate(tweet_links, 1):
+                            print(f"Scraping tweet {i}/{len(tweet_links)}: {link}")
+                        
+                            # Try scraping with retries
+                            content = self._scrape_with_retries(scraper, link, max_retries)
+                        
+                            if content:
+                                out.write(f"{content}\n")
+                                scraped_count += 1
+                                print(f"✓ Successfully scraped tweet {i}")
+                            else:
+                                failed_links.append(link)
+                                print(f"✗ Failed to scrape tweet {i}")
+                        
+                            # Random delay between tweets
+                            if i < len(tweet_links):
+                                delay = random.randint(3, 5)
+                                print(f"Waiting {delay} seconds...")
+                                time.sleep(delay)
+            os.replace(tmp_path, output_file)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
         
         print(f"\nScraping completed!")
-        print(f"Successfully scraped: {len(scraped_content)} tweets")
+        print(f"Successfully scraped: {scraped_count} tweets")
         print(f"Failed: {len(failed_links)} tweets")
         print(f"Results saved to: {output_file}")
         
@@ -1005,11 +1626,10 @@ class TwitterAutomationCLI:
             for link in failed_links:
                 print(f"  - {link}")
         
-        scraper.cleanup()
         return True
     
     def _scrape_with_retries(self, scraper: TweetScraper, link: str, max_retries: int = 3) -> Optional[str]:
-        """Scrape with retry logic"""
+        """Scrape with retry logic (backing off 1s, 2s, 4s, ... up to 8s between attempts)"""
         for attempt in range(max_retries):
             try:
                 content = scraper.scrape_tweet_content(link)
@@ -1017,14 +1637,14 @@ class TwitterAutomationCLI:
                     return content
                 elif attempt < max_retries - 1:
                     print(f"  Attempt {attempt + 1} failed: No content found, retrying...")
-                    time.sleep(2)
+                    time.sleep(min(2 ** attempt, 8))
                     continue
                 else:
                     print(f"  All attempts failed: No content found")
             except Exception as e:
                 if attempt < max_retries - 1:
                     print(f"  Attempt {attempt + 1} failed: {e}, retrying...")
-                    time.sleep(2)
+                    time.sleep(min(2 ** attempt, 8))
                     continue
                 else:
                     print(f"  All attempts failed: {e}")
@@ -1043,8 +1663,7 @@ class TwitterAutomationCLI:
             return False
         
         # Read tweet links
-        with open(tweet_links_file, 'r', encoding='utf-8') as f:
-            tweet_links = [line.strip() for line in f if line.strip()]
+        tweet_links = _read_lines(tweet_links_file)
         
         if not tweet_links:
             print("Error: No tweet links found in file")
@@ -1053,8 +1672,7 @@ class TwitterAutomationCLI:
         # Read reply comments if provided
         reply_comments = []
         if reply_comments_file and os.path.exists(reply_comments_file):
-            with open(reply_comments_file, 'r', encoding='utf-8') as f:
-                reply_comments = [line.strip() for line in f if line.strip()]
+            reply_comments = _read_lines(reply_comments_file)
         
         # Default actions if none provided
         if not actions:
@@ -1073,12 +1691,14 @@ class TwitterAutomationCLI:
             print("Failed to initialize Chrome driver")
             return False
         
-        # Randomize tweet order
+        # Randomize tweet order and the waits between tweets up front
         tweet_indices = list(range(len(tweet_links)))
         random.shuffle(tweet_indices)
+        wait_times = [random.randint(min_wait, max_wait) for _ in range(len(tweet_indices) - 1)]
         
         success_count = 0
         failure_count = 0
+        preloaded = False
         
         try:
             for i, tweet_idx in enumerate(tweet_indices):
@@ -1088,7 +1708,7 @@ class TwitterAutomationCLI:
                 print(f"\nProcessing tweet {i+1}/{len(tweet_links)}: {tweet_url}")
                 
                 try:
-                    success = automation.process_tweet(tweet_url, reply_comment, actions, max_retries)
+                    success = automation.process_tweet(tweet_url, reply_comment, actions, max_retries, preloaded)
                     
                     if success:
                         success_count += 1
@@ -1104,11 +1724,14 @@ class TwitterAutomationCLI:
                     automation.log_to_file("failure_log.txt", f"ERROR: {tweet_url} - {str(e)}")
                     print(f"✗ Error processing tweet: {str(e)}")
                 
-                # Random wait between tweets
+                # Random wait between tweets; the next tweet loads during
+                # the wait, so only the rest of it is slept
                 if i < len(tweet_links) - 1:
-                    wait_time = random.randint(min_wait, max_wait)
+                    wait_time = wait_times[i]
                     print(f"Waiting {wait_time} seconds before next tweet...")
-                    time.sleep(wait_time)
+                    wait_started = time.monotonic()
+                    preloaded = automation.preload_tweet(tweet_links[tweet_indices[i + 1]])
+                    time.sleep(max(0, wait_time - (time.monotonic() - wait_started)))
             
             print(f"\nAutomation completed!")
             print(f"Success: {success_count}, Failures: {failure_count}")
@@ -1137,6 +1760,7 @@ def main():
     parser.add_argument('--reply-comments', type=str, help='File containing reply comments')
     parser.add_argument('--output', type=str, default='scraped_tweets.txt', help='Output file for scraped content')
     parser.add_argument('--max-retries', type=int, default=3, help='Maximum retries for each operation')
+    parser.add_argument('--workers', type=int, default=1, help='Browsers to scrape with in parallel')
     parser.add_argument('--like', action='store_true', help='Like tweets')
     parser.add_argument('--retweet', action='store_true', help='Retweet tweets')
     parser.add_argument('--reply', action='store_true', help='Reply to tweets')
@@ -1157,7 +1781,7 @@ def main():
         if not args.profile:
             print("Error: --profile is required for scraping")
             sys.exit(1)
-        cli.scrape_tweets(args.profile, args.tweet_links, args.output, args.max_retries)
+        cli.scrape_tweets(args.profile, args.tweet_links, args.output, args.max_retries, args.workers)
     elif args.automate:
         if not args.profile:
             print("Error: --profile is required for automation")
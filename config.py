@@ -3,10 +3,12 @@ Configuration module for the Twitter automation app
 """
 
 import os
-import json
+import atexit
 from pathlib import Path
 from typing import Dict, Optional
 
+from persistence import dumps, read_json, write_atomic
+
 class Config:
     """Configuration class for the Twitter automation app"""
     
@@ -14,6 +16,9 @@ class Config:
         self.config_dir = Path("app/config")
         self.config_dir.mkdir(parents=True, exist_ok=True)
         self.config_file = self.config_dir / "settings.json"
+        # Setters only mark the settings dirty; flush() (run at exit) saves them
+        self._dirty = False
+        self._flush_registered = False
         self.load_config()
     
     def load_config(self):
@@ -32,25 +37,36 @@ class Config:
             "log_level": "INFO"
         }
         
-        if self.config_file.exists():
-            try:
-                with open(self.config_file, 'r', encoding='utf-8') as f:
-                    self.settings = {**default_config, **json.load(f)}
-            except Exception as e:
-                print(f"Error loading config: {e}")
-                self.settings = default_config
-        else:
+        # read_json parses with orjson when it is installed (see persistence)
+        try:
+            self.settings = {**default_config, **read_json(self.config_file)}
+        except FileNotFoundError:
             self.settings = default_config
             self.save_config()
+        except Exception as e:
+            print(f"Error loading config: {e}")
+            self.settings = default_config
     
     def save_config(self):
         """Save configuration to file"""
         try:
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(self.settings, f, indent=2, ensure_ascii=False)
+            write_atomic(self.config_file, dumps(self.settings, indent=True))
+            self._dirty = False
         except Exception as e:
             print(f"Error saving config: {e}")
     
+    def flush(self):
+        """Save settings changed through set() or the property setters"""
+        if self._dirty:
+            self.save_config()
+    
+    def _mark_dirty(self):
+        """Remember that settings changed; they are saved by flush(), at the latest on exit"""
+        self._dirty = True
+        if not self._flush_registered:
+            atexit.register(self.flush)
+            self._flush_registered = True
+    
     def get(self, key: str) -> Optional[str]:
         """Get a configuration value"""
         return self.settings.get(key)
@@ -58,10 +74,10 @@ class Config:
     def set(self, key: str, value: any):
         """Set a configuration value"""
         self.settings[key] = value
-        self.save_config()
+        self._mark_dirty()
     
     def update(self, settings: Dict):
-        """Update multiple settings at once"""
+        """Update multiple settings at once (saved immediately, with any pending changes)"""
         self.settings.update(settings)
         self.save_config()
     
@@ -74,7 +90,7 @@ class Config:
     def use_gui_chrome(self, value: bool):
         """Set whether to use GUI Chrome via VNC"""
         self.settings["use_gui_chrome"] = value
-        self.save_config()
+        self._mark_dirty()
     
     @property
     def vnc_display(self) -> str:
@@ -85,7 +101,7 @@ class Config:
     def vnc_display(self, value: str):
         """Set the VNC display number"""
         self.settings["vnc_display"] = value
-        self.save_config()
+        self._mark_dirty()
     
     @property
     def chrome_profile_dir(self) -> str:
@@ -99,7 +115,7 @@ class Config:
     def chrome_profile_dir(self, value: str):
         """Set the Chrome profile directory"""
         self.settings["chrome_profile_dir"] = value
-        self.save_config()
+        self._mark_dirty()
     
     @property
     def chromedriver_path(self) -> Optional[str]:
@@ -110,7 +126,7 @@ class Config:
     def chromedriver_path(self, value: str):
         """Set the ChromeDriver path"""
         self.settings["chromedriver_path"] = value
-        self.save_config()
+        self._mark_dirty()
     
     @property
     def min_wait_time(self) -> int:
@@ -121,7 +137,7 @@ class Config:
     def min_wait_time(self, value: int):
         """Set the minimum wait time"""
         self.settings["min_wait_time"] = value
-        self.save_config()
+        self._mark_dirty()
     
     @property
     def max_wait_time(self) -> int:
@@ -132,7 +148,7 @@ class Config:
     def max_wait_time(self, value: int):
         """Set the maximum wait time"""
         self.settings["max_wait_time"] = value
-        self.save_config()
+        self._mark_dirty()
     
     @property
     def max_retries(self) -> int:
@@ -143,7 +159,7 @@ class Config:
     def max_retries(self, value: int):
         """Set the maximum number of retries"""
         self.settings["max_retries"] = value
-        self.save_config()
+        self._mark_dirty()
     
     @property
     def log_level(self) -> str:
@@ -154,7 +170,7 @@ class Config:
     def log_level(self, value: str):
         """Set the log level"""
         self.settings["log_level"] = value
-        self.save_config()
+        self._mark_dirty()
 
 # Global configuration instance
 config = Config()
@@ -0,0 +1,93 @@
+"""
+State file helpers for the Twitter automation app
+"""
+
+import os
+import tempfile
+
+# orjson is an optional speed-up; fall back to the standard library
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    import json
+    ORJSON_AVAILABLE = False
+
+# msgpack is optional too; pack() writes JSON when it is missing
+try:
+    import msgpack
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    MSGPACK_AVAILABLE = False
+
+
+def dumps(obj, indent: bool = False) -> bytes:
+    """Serialize an object to UTF-8 JSON bytes"""
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option)
+    if indent:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+    return json.dumps(obj, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+
+def loads(data):
+    """Parse JSON from bytes or str"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def pack(obj) -> bytes:
+    """Serialize an object compactly (msgpack when installed, JSON otherwise)"""
+    if MSGPACK_AVAILABLE:
+        return msgpack.packb(obj, use_bin_type=True)
+    return dumps(obj)
+
+
+def unpack(data: bytes):
+    """Parse data written by pack(), detecting JSON vs msgpack from the first byte"""
+    if data.lstrip()[:1] in (b'{', b'['):
+        return loads(data)
+    if not MSGPACK_AVAILABLE:
+        raise ValueError("state file is msgpack-encoded but msgpack is not installed")
+    return msgpack.unpackb(data, raw=False)
+
+
+def read_packed(path):
+    """Read and parse a file written with pack()"""
+    with open(path, 'rb') as f:
+        return unpack(f.read())
+
+
+def read_json(path):
+    """Read and parse a JSON file"""
+    with open(path, 'rb') as f:
+        return loads(f.read())
+
+
+def write_atomic(path, data: bytes):
+    """
+    Write a file so readers never observe a partially written state
+
+    The data goes to a temporary file in the same directory which is then
+    renamed over the target with os.replace().
+
+    Args:
+        path: Destination file path
+        data (bytes): Complete file contents
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".tmp-", suffix=os.path.basename(path))
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
@@ -0,0 +1,294 @@
+"""
+Process table helpers for the Twitter automation app
+"""
+
+import os
+import re
+import selectors
+import signal
+import subprocess
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Dict, Iterator, List, Optional, Pattern, Tuple
+
+PROC_DIR = "/proc"
+
+
+@lru_cache(maxsize=64)
+def _compile_patterns(patterns: Tuple[str, ...]) -> Tuple[Pattern, List[Pattern]]:
+    """Compile patterns once: a combined alternation plus each pattern on its own"""
+    combined = re.compile('|'.join(f'(?:{pattern})' for pattern in patterns))
+    return combined, [re.compile(pattern) for pattern in patterns]
+
+
+def _read_proc_file(path: str) -> Optional[bytes]:
+    """
+    Read a whole /proc file with raw os.read() calls (None if it is gone)
+
+    Skips the buffered file object open() would build, which costs more
+    than the read itself for these small files.
+    """
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return None
+    try:
+        chunks = []
+        while True:
+            chunk = os.read(fd, 131072)
+            if not chunk:
+                return b''.join(chunks)
+            chunks.append(chunk)
+    except OSError:
+        return None
+    finally:
+        os.close(fd)
+
+
+def iter_processes() -> Iterator[Tuple[int, str]]:
+    """
+    Yield (pid, cmdline) for every process visible in /proc
+
+    Kernel threads (empty cmdline), processes that exit mid-scan and the
+    calling process itself are skipped, mirroring pgrep -f.
+    """
+    own_pid = os.getpid()
+    with os.scandir(PROC_DIR) as entries:
+        for entry in entries:
+            if not entry.name.isdigit():
+                continue
+            pid = int(entry.name)
+            if pid == own_pid:
+                continue
+            raw = _read_proc_file(f"{PROC_DIR}/{entry.name}/cmdline")
+            if raw:
+                yield pid, raw.rstrip(b'\0').replace(b'\0', b' ').decode('utf-8', 'replace')
+
+
+def _pgrep(pattern: str) -> List[int]:
+    """Run pgrep -f for one pattern (used where /proc is not available)"""
+    try:
+        result = subprocess.run(['pgrep', '-f', pattern], capture_output=True, text=True, timeout=5)
+    except (OSError, subprocess.TimeoutExpired):
+        return []
+    return [int(pid) for pid in result.stdout.split()]
+
+
+class ProcSnapshot:
+    """Point-in-time copy of the process table that can be queried many times"""
+
+    def __init__(self):
+        # Without /proc (e.g. macOS) every query falls back to pgrep
+        self.processes = list(iter_processes()) if os.path.isdir(PROC_DIR) else None
+
+    def pids(self, pattern: str) -> List[int]:
+        """Return the PIDs whose command line matches a pgrep -f style regular expression"""
+        if self.processes is None:
+            return _pgrep(pattern)
+        search = _compile_patterns((pattern,))[0].search
+        return [pid for pid, cmdline in self.processes if search(cmdline)]
+
+    def matching(self, patterns: List[str]) -> Dict[str, List[int]]:
+        """
+        Match several patterns against the snapshot
+
+        Args:
+            patterns (List[str]): pgrep -f style regular expressions (e.g. "vncserver.*:1")
+
+        Returns:
+            Dict[str, List[int]]: Matching PIDs for every pattern (empty list if none)
+        """
+        if self.processes is None:
+            # Run the pgrep calls concurrently rather than one after another
+            with ThreadPoolExecutor(max_workers=max(len(patterns), 1)) as executor:
+                return dict(zip(patterns, executor.map(_pgrep, patterns)))
+
+        # One regex pass per process; only the rare hits are attributed to
+        # the individual patterns
+        combined, compiled = _compile_patterns(tuple(patterns))
+        matches = {pattern: [] for pattern in patterns}
+        for pid, cmdline in self.processes:
+            if combined.search(cmdline):
+                for pattern, regex in zip(patterns, compiled):
+                    if regex.search(cmdline):
+                        matches[pattern].append(pid)
+        return matches
+
+
+def scan_proc(patterns: List[str]) -> Dict[str, List[int]]:
+    """
+    Find the processes matching each pattern with a single pass over /proc
+
+    Args:
+        patterns (List[str]): pgrep -f style regular expressions (e.g. "vncserver.*:1")
+
+    Returns:
+        Dict[str, List[int]]: Matching PIDs for every pattern (empty list if none)
+    """
+    return ProcSnapshot().matching(patterns)
+
+
+def process_info(pid: int) -> Optional[Tuple[int, str]]:
+    """
+    Read a process's parent PID and command line from /proc
+
+    Args:
+        pid (int): Process to look up
+
+    Returns:
+        Optional[Tuple[int, str]]: (ppid, cmdline), or None if the process is gone
+    """
+    stat = _read_proc_file(f"{PROC_DIR}/{pid}/stat")
+    raw = _read_proc_file(f"{PROC_DIR}/{pid}/cmdline")
+    if stat is None or raw is None:
+        return None
+    # Fields after the parenthesised command name: state, ppid, ...
+    ppid = int(stat[stat.rindex(b')') + 2:].split(None, 2)[1])
+    if raw:
+        cmdline = raw.rstrip(b'\0').replace(b'\0', b' ').decode('utf-8', 'replace')
+    else:
+        # Kernel threads have no cmdline; ps shows their name in brackets
+        cmdline = f"[{stat[stat.index(b'(') + 1:stat.rindex(b')')].decode('utf-8', 'replace')}]"
+    return ppid, cmdline
+
+
+def _pid_alive(pid: int) -> bool:
+    """Check whether a PID still refers to a running (non-zombie) process"""
+    try:
+        with open(f"{PROC_DIR}/{pid}/stat", 'rb') as f:
+            stat = f.read()
+        # The state field follows the parenthesised command name
+        state_at = stat.rindex(b')') + 2
+        return stat[state_at:state_at + 1] != b'Z'
+    except FileNotFoundError:
+        return False
+    except OSError:
+        try:
+            os.kill(pid, 0)
+            return True
+        except ProcessLookupError:
+            return False
+
+
+def wait_for_exit(pid: int, timeout: float) -> bool:
+    """
+    Wait up to timeout seconds for a process to exit
+
+    Uses a pidfd so the wait ends the moment the process dies; falls back
+    to polling where pidfd_open is unavailable (Python < 3.9, Linux < 5.3).
+
+    Args:
+        pid (int): Process to watch
+        timeout (float): Maximum time to wait in seconds
+
+    Returns:
+        bool: True if the process exited, False if it is still running
+    """
+    try:
+        pidfd = os.pidfd_open(pid, 0)
+    except ProcessLookupError:
+        return True
+    except (AttributeError, OSError):
+        deadline = time.monotonic() + timeout
+        while _pid_alive(pid):
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            time.sleep(min(0.1, remaining))
+        return True
+
+    try:
+        with selectors.DefaultSelector() as selector:
+            selector.register(pidfd, selectors.EVENT_READ)
+            return bool(selector.select(timeout))
+    finally:
+        os.close(pidfd)
+
+
+def wait_for_path(path: str, timeout: float, pid: int = None, interval: float = 0.1) -> bool:
+    """
+    Wait for a file to appear (e.g. the SingletonLock Chrome creates in its profile)
+
+    Args:
+        path (str): File to wait for (symlinks count even if dangling)
+        timeout (float): Maximum time to wait in seconds
+        pid (int): Optional process that is expected to create the file; the
+            wait ends as soon as it exits
+        interval (float): How often to check for the file
+
+    Returns:
+        bool: True if the file exists when the wait ends
+    """
+    deadline = time.monotonic() + timeout
+    while not os.path.lexists(path):
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+        if pid is None:
+            time.sleep(min(interval, remaining))
+        elif wait_for_exit(pid, min(interval, remaining)):
+            return os.path.lexists(path)
+    return True
+
+
+def wait_for_match(pattern: str, timeout: float, interval: float = 0.05) -> List[int]:
+    """
+    Wait for a process whose command line matches a pattern to appear
+
+    Args:
+        pattern (str): pgrep -f style regular expression
+        timeout (float): Maximum time to wait in seconds
+        interval (float): How often to rescan the process table
+
+    Returns:
+        List[int]: Matching PIDs (empty if none appeared before the timeout)
+    """
+    deadline = time.monotonic() + timeout
+    while True:
+        pids = ProcSnapshot().pids(pattern)
+        remaining = deadline - time.monotonic()
+        if pids or remaining <= 0:
+            return pids
+        time.sleep(min(interval, remaining))
+
+
+class ProcessHandle:
+    """
+    Signal a specific process without the PID-reuse race of os.kill()
+
+    A pidfd is opened up front where supported (Linux 5.3+, Python 3.9+),
+    so a later signal can only reach the process it was opened for.
+    """
+
+    def __init__(self, pid: int):
+        self.pid = pid
+        self.pidfd = None
+        if hasattr(os, 'pidfd_open') and hasattr(signal, 'pidfd_send_signal'):
+            try:
+                self.pidfd = os.pidfd_open(pid, 0)
+            except OSError:
+                pass
+
+    def send_signal(self, sig: int = signal.SIGTERM) -> bool:
+        """Send a signal; returns False if the process has already gone"""
+        try:
+            if self.pidfd is not None:
+                signal.pidfd_send_signal(self.pidfd, sig)
+            else:
+                os.kill(self.pid, sig)
+            return True
+        except ProcessLookupError:
+            return False
+
+    def close(self):
+        """Release the pidfd"""
+        if self.pidfd is not None:
+            os.close(self.pidfd)
+            self.pidfd = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
@@ -3,89 +3,179 @@ VNC checker utility for the Twitter automation app
 """
 
 import os
+import re
+import time
+import shutil
+import signal
 import subprocess
-from typing import Tuple, Optional
+from functools import lru_cache
+from typing import Dict, List, Tuple, Optional
 
-def check_vnc_running(display: str = ":1") -> Tuple[bool, Optional[str]]:
+from process_utils import ProcSnapshot, ProcessHandle, process_info
+
+# Status results are reused for this many seconds so the different checks
+# below share one probe instead of each running their own subprocesses
+STATUS_TTL = 1.0
+
+_status_cache: Dict[str, Tuple[float, dict]] = {}
+
+
+def clear_vnc_status_cache():
+    """Forget cached VNC status (call after starting or stopping a VNC server)"""
+    _status_cache.clear()
+
+
+# VNC server programs looked for on a display
+VNC_SERVER_NAMES = ("vncserver", "Xtightvnc", "tightvncserver", "tigervncserver", "x11vnc")
+
+
+@lru_cache(maxsize=16)
+def _vnc_pattern(display: str) -> str:
+    """pgrep -f style pattern matching any VNC server on the display"""
+    return f'({"|".join(VNC_SERVER_NAMES)}).*{re.escape(display)}'
+
+
+def _scan_vnc_pids(display: str, snapshot: ProcSnapshot = None) -> List[int]:
     """
-    Check if VNC server is running on the specified display
+    Return the PIDs of the VNC servers running on the display
     
-    Args:
-        display (str): VNC display number (e.g., ":1")
-        
-    Returns:
-        Tuple[bool, Optional[str]]: (is_running, error_message)
+    The command lines are read from /proc in-process (see process_utils);
+    only systems without /proc fall back to running pgrep.
     """
+    if snapshot is None:
+        snapshot = ProcSnapshot()
+    return snapshot.pids(_vnc_pattern(display))
+
+
+def _vnc_in_process_list(display: str, snapshot: ProcSnapshot = None) -> bool:
+    """Fallback check: look for a VNC server for the display in the process list"""
+    # Looser than _scan_vnc_pids: any case, display anywhere on the line
+    vnc_processes = [name.lower() for name in VNC_SERVER_NAMES]
+    if snapshot is not None and snapshot.processes is not None:
+        return any(
+            display in cmdline and any(proc in cmdline.lower() for proc in vnc_processes)
+            for _, cmdline in snapshot.processes
+        )
+    try:
+        ps_output = subprocess.check_output(
+            ["ps", "aux"],
+            universal_newlines=True,
+            timeout=5
+        )
+        
+        for line in ps_output.split('\n'):
+            if any(proc in line.lower() for proc in vnc_processes) and display in line:
+                return True
+    except subprocess.TimeoutExpired:
+        pass
+    except Exception:
+        pass
+    return False
+
+
+def _x_display_accessible(display: str) -> bool:
+    """Fallback check: DISPLAY points at this display and the X server answers"""
+    if os.environ.get("DISPLAY") != display:
+        return False
+    try:
+        subprocess.check_call(
+            ["xdpyinfo"],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            timeout=5
+        )
+        return True
+    except (subprocess.CalledProcessError, subprocess.TimeoutExpired, OSError):
+        return False
+
+
+def _which(program: str) -> bool:
+    """Check whether a program is on the PATH"""
+    return shutil.which(program) is not None
+
+
+def _probe_vnc_status(display: str) -> dict:
+    """Run every VNC check once and collect the results"""
+    status = {
+        'running': False,
+        'display_reachable': False,
+        'display': display,
+        'pids': [],
+        'processes': [],
+        'errors': [],
+        'installed': False,
+        'xfce4': False,
+        'environment_ready': False
+    }
+    
     if os.name != 'posix':
-        return False, "VNC check only supported on Linux"
+        status['errors'].append("VNC is only supported on Linux")
+        return status
     
     try:
-        # Method 1: Check using pgrep for various VNC server types
-        vnc_patterns = [
-            f'vncserver.*{display}',
-            f'Xtightvnc.*{display}',
-            f'tightvncserver.*{display}',
-            f'tigervncserver.*{display}',
-            f'x11vnc.*{display}'
-        ]
+        # Check if VNC is running (both process checks share one /proc scan)
+        snapshot = ProcSnapshot()
+        status['pids'] = _scan_vnc_pids(display, snapshot)
+        # Only a matching VNC server process counts as running; the looser
+        # process-list and X display fallbacks are kept for check_vnc_running
+        status['running'] = bool(status['pids'])
+        status['display_reachable'] = (status['running'] or _vnc_in_process_list(display, snapshot)
+                                       or _x_display_accessible(display))
+        if not status['running']:
+            status['errors'].append(f"No VNC server found running on display {display}")
         
-        for pattern in vnc_patterns:
-            try:
-                result = subprocess.run(['pgrep', '-f', pattern], 
-                                      capture_output=True, text=True, timeout=5)
-                if result.returncode == 0:
-                    return True, None
-            except subprocess.TimeoutExpired:
-                pass
-            except Exception:
-                pass
-        
-        # Method 2: Check using ps aux (fallback method)
-        try:
-            ps_output = subprocess.check_output(
-                ["ps", "aux"],
-                universal_newlines=True,
-                timeout=5
-            )
-            
-            # Look for common VNC server processes
-            vnc_processes = [
-                "tightvncserver",
-                "Xtightvnc",
-                "x11vnc",
-                "vncserver",
-                "tigervncserver"
-            ]
-            
-            for line in ps_output.split('\n'):
-                if any(proc in line.lower() for proc in vnc_processes) and display in line:
-                    return True, None
-        except subprocess.TimeoutExpired:
-            pass
-        except Exception:
-            pass
-        
-        # Method 3: Check if DISPLAY environment variable is set and X server is accessible
-        if "DISPLAY" in os.environ and os.environ["DISPLAY"] == display:
-            try:
-                subprocess.check_call(
-                    ["xdpyinfo"],
-                    stdout=subprocess.DEVNULL,
-                    stderr=subprocess.DEVNULL,
-                    timeout=5
-                )
-                return True, None
-            except (subprocess.CalledProcessError, subprocess.TimeoutExpired):
-                pass
-        
-        return False, f"No VNC server found running on display {display}"
+        # Get VNC process info if running ("pid ppid cmd", read from /proc)
+        for pid in status['pids']:
+            info = process_info(pid)
+            if info:
+                status['processes'].append(f"{pid} {info[0]} {info[1]}")
         
+        # Check environment
+        status['xfce4'] = _which("xfce4-session")
+        status['installed'] = any(_which(vnc_server) for vnc_server in
+                                  ["tightvncserver", "x11vnc", "vncserver", "tigervncserver"])
+        if not status['xfce4']:
+            status['errors'].append("XFCE desktop environment not found")
+        elif not status['installed']:
+            status['errors'].append("No VNC server found (tightvncserver, x11vnc, vncserver, or tigervncserver)")
+        else:
+            status['environment_ready'] = status['running']
     except Exception as e:
-        return False, f"Error checking VNC status: {str(e)}"
+        status['errors'].append(f"Error checking VNC status: {str(e)}")
+    
+    return status
 
-def check_vnc_running_simple(display: str = ":1") -> Tuple[bool, Optional[str]]:
+
+def get_vnc_status(display: str = ":1", max_age: float = STATUS_TTL) -> dict:
+    """
+    Get comprehensive VNC status information
+    
+    The result is cached per display for max_age seconds; the other check
+    functions in this module are derived from it.
+    
+    Args:
+        display (str): VNC display number (e.g., ":1")
+        max_age (float): Maximum age in seconds of a cached result (0 forces a new probe)
+        
+    Returns:
+        dict: Status information: running (a VNC server process matched),
+            display_reachable (running, or the display answers some other
+            way), pids, processes, installed (a VNC server binary exists),
+            xfce4, environment_ready and errors
+    """
+    now = time.monotonic()
+    cached = _status_cache.get(display)
+    if cached and now - cached[0] < max_age:
+        return cached[1]
+    
+    status = _probe_vnc_status(display)
+    _status_cache[display] = (now, status)
+    return status
+
+
+def check_vnc_running(display: str = ":1") -> Tuple[bool, Optional[str]]:
     """
-    Simple VNC check using pgrep (used by start_vnc function for consistency)
+    Check if VNC server is running on the specified display
     
     Args:
         display (str): VNC display number (e.g., ":1")
@@ -96,144 +186,52 @@ def check_vnc_running_simple(display: str = ":1") -> Tuple[bool, Optional[str]]:
     if os.name != 'posix':
         return False, "VNC check only supported on Linux"
     
-    try:
-        # Check for various VNC server types
-        vnc_patterns = [
-            f'vncserver.*{display}',
-            f'Xtightvnc.*{display}',
-            f'tightvncserver.*{display}',
-            f'tigervncserver.*{display}',
-            f'x11vnc.*{display}'
-        ]
-        
-        for pattern in vnc_patterns:
-            result = subprocess.run(['pgrep', '-f', pattern], 
-                                  capture_output=True, text=True, timeout=5)
-            if result.returncode == 0:
-                return True, None
-        
-        return False, f"No VNC server found running on display {display}"
-    except subprocess.TimeoutExpired:
-        return False, "VNC status check timed out"
-    except Exception as e:
-        return False, f"Error checking VNC status: {str(e)}"
+    status = get_vnc_status(display)
+    if status['display_reachable']:
+        return True, None
+    return False, status['errors'][0]
 
-def verify_vnc_environment(display: str = ":1") -> Tuple[bool, Optional[str]]:
+
+def check_vnc_running_simple(display: str = ":1") -> Tuple[bool, Optional[str]]:
     """
-    Verify the VNC environment is properly set up
+    Simple VNC check: only a matching VNC server process counts (used by start_vnc function for consistency)
+    
+    Unlike check_vnc_running, the process-list and X display fallbacks are
+    ignored; both checks share the same cached probe.
     
     Args:
         display (str): VNC display number (e.g., ":1")
         
     Returns:
-        Tuple[bool, Optional[str]]: (is_ready, error_message)
+        Tuple[bool, Optional[str]]: (is_running, error_message)
     """
     if os.name != 'posix':
-        return False, "VNC environment check only supported on Linux"
+        return False, "VNC check only supported on Linux"
     
-    try:
-        # Check if XFCE is installed
-        try:
-            subprocess.check_call(
-                ["which", "xfce4-session"],
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL
-            )
-        except subprocess.CalledProcessError:
-            return False, "XFCE desktop environment not found"
-        
-        # Check if VNC server is installed
-        vnc_found = False
-        for vnc_server in ["tightvncserver", "x11vnc", "vncserver", "tigervncserver"]:
-            try:
-                subprocess.check_call(
-                    ["which", vnc_server],
-                    stdout=subprocess.DEVNULL,
-                    stderr=subprocess.DEVNULL
-                )
-                vnc_found = True
-                break
-            except subprocess.CalledProcessError:
-                continue
-        
-        if not vnc_found:
-            return False, "No VNC server found (tightvncserver, x11vnc, vncserver, or tigervncserver)"
-        
-        # Check if VNC is running using the simple method for consistency
-        vnc_running, error = check_vnc_running_simple(display)
-        if not vnc_running:
-            return False, error
-        
+    status = get_vnc_status(display)
+    if status['running']:
         return True, None
-        
-    except Exception as e:
-        return False, f"Error verifying VNC environment: {str(e)}"
+    return False, status['errors'][0]
 
-def get_vnc_status(display: str = ":1") -> dict:
+
+def verify_vnc_environment(display: str = ":1") -> Tuple[bool, Optional[str]]:
     """
-    Get comprehensive VNC status information
+    Verify the VNC environment is properly set up
     
     Args:
         display (str): VNC display number (e.g., ":1")
         
     Returns:
-        dict: Status information including running state, processes, and errors
+        Tuple[bool, Optional[str]]: (is_ready, error_message)
     """
-    status = {
-        'running': False,
-        'display': display,
-        'processes': [],
-        'errors': [],
-        'environment_ready': False
-    }
-    
     if os.name != 'posix':
-        status['errors'].append("VNC is only supported on Linux")
-        return status
-    
-    # Check if VNC is running
-    vnc_running, error = check_vnc_running_simple(display)
-    status['running'] = vnc_running
-    if error:
-        status['errors'].append(error)
-    
-    # Get VNC processes if running
-    if vnc_running:
-        try:
-            # Check for various VNC server types
-            vnc_patterns = [
-                f'vncserver.*{display}',
-                f'Xtightvnc.*{display}',
-                f'tightvncserver.*{display}',
-                f'tigervncserver.*{display}',
-                f'x11vnc.*{display}'
-            ]
-            
-            for pattern in vnc_patterns:
-                result = subprocess.run(['pgrep', '-f', pattern], 
-                                      capture_output=True, text=True, timeout=5)
-                if result.returncode == 0:
-                    pids = result.stdout.strip().split('\n')
-                    for pid in pids:
-                        if pid:
-                            try:
-                                ps_result = subprocess.run(['ps', '-p', pid, '-o', 'pid,ppid,cmd'], 
-                                                         capture_output=True, text=True, timeout=5)
-                                if ps_result.returncode == 0:
-                                    status['processes'].append(ps_result.stdout.strip())
-                            except Exception:
-                                pass
-                    break  # Found processes, no need to check other patterns
-        except Exception as e:
-            status['errors'].append(f"Error getting process info: {str(e)}")
-    
-    # Check environment
-    env_ready, env_error = verify_vnc_environment(display)
-    status['environment_ready'] = env_ready
-    if env_error:
-        status['errors'].append(env_error)
+        return False, "VNC environment check only supported on Linux"
     
-    return status
+    status = get_vnc_status(display)
+    if status['environment_ready']:
+        return True, None
+    # Installation problems are reported before "not running"
+    return False, status['errors'][-1]
 
 def cleanup_stale_vnc_processes(display: str = ":1") -> Tuple[bool, Optional[str]]:
     """
@@ -250,39 +248,22 @@ def cleanup_stale_vnc_processes(display: str = ":1") -> Tuple[bool, Optional[str
     
     try:
         # Find VNC processes for the display
-        vnc_patterns = [
-            f'vncserver.*{display}',
-            f'Xtightvnc.*{display}',
-            f'tightvncserver.*{display}',
-            f'tigervncserver.*{display}',
-            f'x11vnc.*{display}'
-        ]
-        
-        result = None
-        for pattern in vnc_patterns:
-            try:
-                result = subprocess.run(['pgrep', '-f', pattern], 
-                                      capture_output=True, text=True, timeout=5)
-                if result.returncode == 0:
-                    break
-            except Exception:
-                continue
+        pids = _scan_vnc_pids(display)
         
-        if result.returncode == 0:
-            pids = result.stdout.strip().split('\n')
+        if pids:
             killed_count = 0
             
             for pid in pids:
-                if pid.strip():
-                    try:
-                        # Kill the process
-                        subprocess.run(['kill', '-9', pid.strip()], 
-                                     capture_output=True, text=True, timeout=5)
-                        killed_count += 1
-                        print(f"Killed VNC process {pid}")
-                    except Exception as e:
-                        print(f"Failed to kill process {pid}: {e}")
+                try:
+                    # Kill the process
+                    with ProcessHandle(pid) as process:
+                        process.send_signal(signal.SIGKILL)
+                    killed_count += 1
+                    print(f"Killed VNC process {pid}")
+                except Exception as e:
+                    print(f"Failed to kill process {pid}: {e}")
             
+            clear_vnc_status_cache()
             if killed_count > 0:
                 return True, f"Cleaned up {killed_count} stale VNC processes"
             else:
@@ -6,13 +6,15 @@ Flask-based web interface for the Twitter automation app
 
 import os
 import sys
-import json
 import time
 import random
+import atexit
+import heapq
 import threading
 import subprocess
+from array import array
 from datetime import datetime
-from typing import List, Dict, Optional
+from typing import List, Dict, Iterator, Optional, Sequence, Tuple
 from pathlib import Path
 
 # Flask imports
@@ -24,10 +26,14 @@ import werkzeug
 try:
     from cli_version import ProfileManager, TweetScraper, TwitterAutomationCLI, TwitterAutomation
     from config import config
+    from persistence import dumps, pack, read_json, read_packed, write_atomic
     try:
-        from vnc_checker import check_vnc_running, check_vnc_running_simple, verify_vnc_environment, cleanup_stale_vnc_processes
+        from vnc_checker import check_vnc_running, check_vnc_running_simple, verify_vnc_environment, cleanup_stale_vnc_processes, clear_vnc_status_cache
     except ImportError:
         # Fallback VNC checker functions if module not available
+        def clear_vnc_status_cache():
+            """The fallback checks are not cached"""
+        
         def check_vnc_running(display: str = ":1"):
             """Check if VNC is running"""
             try:
@@ -171,88 +177,199 @@ automation_states = {}  # Store automation state for each task
 class TaskStateManager:
     """Manage persistent task state that survives page refreshes"""
     
-    def __init__(self, state_file: str = "task_state.json"):
+    FINISHED_STATUSES = ('completed', 'error', 'cancelled')
+    # Only the newest log lines are kept per task so saves stay a constant size;
+    # older lines are appended to <TASK_LOGS_ARCHIVE_DIR>/<task_id>.log if set
+    LOGS_MAXLEN = int(os.environ.get('TASK_LOGS_MAXLEN', '512'))
+    LOGS_ARCHIVE_DIR = os.environ.get('TASK_LOGS_ARCHIVE_DIR')
+    
+    def __init__(self, state_file: str = "task_state.msgpack", legacy_state_file: str = "task_state.json"):
         self.state_file = state_file
+        # State saved as JSON by older versions; read once if state_file is missing
+        self.legacy_state_file = legacy_state_file
+        # Adding or removing tasks publishes a new task_status dict, so it can
+        # be iterated without locking; task records are updated in place
+        # under _write_lock and copied only when a save takes a snapshot
         self.task_status = {}
         self.active_threads = {}
+        self._write_lock = threading.Lock()
+        self._save_lock = threading.Lock()
+        # Start times parsed once, and a min-heap of (start timestamp, task_id)
+        # for finished tasks so cleanup only touches expired entries
+        self._start_timestamps = {}
+        self._finished_heap = []
         self.load_state()
     
+    def _track_task(self, task_id: str, task_data: dict):
+        """Record a task's start timestamp and queue it for cleanup if finished"""
+        try:
+            timestamp = datetime.fromisoformat(task_data['start_time']).timestamp()
+        except (KeyError, TypeError, ValueError):
+            return
+        self._start_timestamps[task_id] = timestamp
+        if task_data.get('status') in self.FINISHED_STATUSES:
+            heapq.heappush(self._finished_heap, (timestamp, task_id))
+    
+    def _trim_logs(self, task_id: str, logs: list):
+        """Drop the oldest log lines beyond LOGS_MAXLEN, archiving them if configured"""
+        overflow = len(logs) - self.LOGS_MAXLEN
+        if overflow <= 0:
+            return
+        if self.LOGS_ARCHIVE_DIR:
+            try:
+                os.makedirs(self.LOGS_ARCHIVE_DIR, exist_ok=True)
+                fd = os.open(os.path.join(self.LOGS_ARCHIVE_DIR, f"{task_id}.log"),
+                             os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+                try:
+                    os.write(fd, ''.join(f"{line}\n" for line in logs[:overflow]).encode('utf-8'))
+                finally:
+                    os.close(fd)
+            except OSError as e:
+                print(f"Error archiving task logs: {e}")
+        del logs[:overflow]
+    
+    def _snapshot(self) -> dict:
+        """Copy every task record (and its log list) while holding _write_lock"""
+        with self._write_lock:
+            snapshot = {}
+            for task_id, task in self.task_status.items():
+                task = dict(task)
+                if isinstance(task.get('logs'), list):
+                    task['logs'] = list(task['logs'])
+                snapshot[task_id] = task
+            return snapshot
+    
     def save_state(self):
         """Save current task state to file"""
         try:
-            state_data = {
-                'task_status': self.task_status,
-                'active_threads': list(self.active_threads.keys()),  # Only save thread IDs
-                'last_updated': datetime.now().isoformat()
-            }
-            
-            with open(self.state_file, 'w', encoding='utf-8') as f:
-                json.dump(state_data, f, indent=2, ensure_ascii=False)
+            with self._save_lock:
+                # Take the newest snapshot once the lock is held so a slower
+                # save can never overwrite the file with older state
+                state_data = {
+                    'task_status': self._snapshot(),
+                    'active_threads': list(self.active_threads.keys()),  # Only save thread IDs
+                    'last_updated': datetime.now().isoformat()
+                }
+                
+                write_atomic(self.state_file, pack(state_data))
         except Exception as e:
             print(f"Error saving task state: {e}")
     
     def load_state(self):
         """Load task state from file"""
         try:
-            if os.path.exists(self.state_file):
-                with open(self.state_file, 'r', encoding='utf-8') as f:
-                    state_data = json.load(f)
+            migrate = (not os.path.exists(self.state_file) and self.legacy_state_file
+                       and self.legacy_state_file != self.state_file
+                       and os.path.exists(self.legacy_state_file))
+            state_file = self.legacy_state_file if migrate else self.state_file
+            if os.path.exists(state_file):
+                state_data = read_packed(state_file)
                 
                 self.task_status = state_data.get('task_status', {})
                 # Note: active_threads are not restored as threads can't be serialized
                 # They will be recreated as needed
                 
+                for task_id, task_data in self.task_status.items():
+                    self._track_task(task_id, task_data)
+                
                 print(f"Loaded {len(self.task_status)} tasks from state file")
+                
+                if migrate:
+                    self.save_state()
+                    if os.path.exists(self.state_file):
+                        os.remove(state_file)
+                        print(f"Migrated task state from {state_file} to {self.state_file}")
         except Exception as e:
             print(f"Error loading task state: {e}")
             self.task_status = {}
     
     def add_task(self, task_id: str, task_data: dict):
         """Add a new task to state"""
-        self.task_status[task_id] = task_data
+        task = dict(task_data)
+        if isinstance(task.get('logs'), list):
+            task['logs'] = list(task['logs'])
+            self._trim_logs(task_id, task['logs'])
+        with self._write_lock:
+            self.task_status = {**self.task_status, task_id: task}
+            self._track_task(task_id, task)
         self.save_state()
     
     def update_task(self, task_id: str, updates: dict):
-        """Update task status"""
-        if task_id in self.task_status:
-            self.task_status[task_id].update(updates)
-            self.save_state()
+        """
+        Update task status
+        
+        A 'log_append' key (a string or list of strings) is appended to the
+        task's logs in place instead of replacing the whole list; the logs
+        are capped at LOGS_MAXLEN lines.
+        """
+        with self._write_lock:
+            task = self.task_status.get(task_id)
+            if task is None:
+                return
+            was_finished = task.get('status') in self.FINISHED_STATUSES
+            if 'log_append' in updates:
+                updates = dict(updates)
+                new_logs = updates.pop('log_append')
+                logs = task.setdefault('logs', [])
+                if isinstance(new_logs, str):
+                    logs.append(new_logs)
+                else:
+                    logs.extend(new_logs)
+                self._trim_logs(task_id, logs)
+            task.update(updates)
+            
+            if not was_finished and task.get('status') in self.FINISHED_STATUSES:
+                timestamp = self._start_timestamps.get(task_id)
+                if timestamp is not None:
+                    heapq.heappush(self._finished_heap, (timestamp, task_id))
+        self.save_state()
     
     def remove_task(self, task_id: str):
         """Remove task from state"""
-        if task_id in self.task_status:
-            del self.task_status[task_id]
-            self.save_state()
+        with self._write_lock:
+            if task_id not in self.task_status:
+                return
+            tasks = dict(self.task_status)
+            del tasks[task_id]
+            self.task_status = tasks
+            self._start_timestamps.pop(task_id, None)
+        self.save_state()
     
     def get_task(self, task_id: str) -> Optional[dict]:
         """Get task by ID"""
         return self.task_status.get(task_id)
     
     def get_all_tasks(self) -> dict:
-        """Get all tasks"""
-        return self.task_status.copy()
+        """Get all tasks (the dict is replaced, never resized, so it is safe to iterate)"""
+        return self.task_status
     
     def cleanup_completed_tasks(self, max_age_hours: int = 24):
-        """Clean up old completed tasks"""
-        cutoff_time = datetime.now().timestamp() - (max_age_hours * 3600)
-        tasks_to_remove = []
-        
-        for task_id, task_data in self.task_status.items():
-            if task_data.get('status') in ['completed', 'error', 'cancelled']:
-                start_time = task_data.get('start_time')
-                if start_time:
-                    try:
-                        task_timestamp = datetime.fromisoformat(start_time).timestamp()
-                        if task_timestamp < cutoff_time:
-                            tasks_to_remove.append(task_id)
-                    except:
-                        pass
+        """Clean up old completed tasks (by start time)"""
+        cutoff_time = time.time() - (max_age_hours * 3600)
         
-        for task_id in tasks_to_remove:
-            self.remove_task(task_id)
+        with self._write_lock:
+            heap = self._finished_heap
+            tasks = None
+            
+            while heap and heap[0][0] < cutoff_time:
+                timestamp, task_id = heapq.heappop(heap)
+                # Skip stale heap entries for tasks already removed or re-added
+                task_data = self.task_status.get(task_id)
+                if (task_data is None or self._start_timestamps.get(task_id) != timestamp
+                        or task_data.get('status') not in self.FINISHED_STATUSES):
+                    continue
+                if tasks is None:
+                    tasks = dict(self.task_status)
+                del tasks[task_id]
+                self._start_timestamps.pop(task_id, None)
+            
+            if tasks is None:
+                return
+            removed = len(self.task_status) - len(tasks)
+            self.task_status = tasks
         
-        if tasks_to_remove:
-            print(f"Cleaned up {len(tasks_to_remove)} old completed tasks")
+        self.save_state()
+        print(f"Cleaned up {removed} old completed tasks")
 
 # Initialize task state manager
 task_state_manager = TaskStateManager()
@@ -671,6 +788,30 @@ class StandardAutomationStrategy(AutomationStrategy):
             'reply': ReplyAction()
         }
 
+def _intern(values: List[str]) -> Tuple[List[str], array]:
+    """Split values into a pool of unique strings and per-item pool indices"""
+    positions = {}
+    indices = array('I', (positions.setdefault(value, len(positions)) for value in values))
+    return list(positions), indices
+
+class _PairedView(Sequence):
+    """Sequence of task dicts built on access from an AutomationState's columns"""
+    
+    def __init__(self, state: 'AutomationState'):
+        self._state = state
+    
+    def __len__(self) -> int:
+        return len(self._state._url_idx)
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("paired task index out of range")
+        return self._state.get_task(index)
+
 class AutomationState:
     """Manage automation state for persistence and recovery"""
     
@@ -679,65 +820,106 @@ class AutomationState:
                  min_wait: int, max_wait: int, max_retries: int):
         self.task_id = task_id
         self.profile_name = profile_name
-        self.tweet_links = tweet_links
-        self.reply_comments = reply_comments
         self.actions = actions
         self.min_wait = min_wait
         self.max_wait = max_wait
         self.max_retries = max_retries
         
-        # Create paired tasks (tweet + comment)
-        self.paired_tasks = self._create_paired_tasks()
+        # Paired tasks (tweet + comment) are stored as parallel columns of
+        # indices into pools of unique strings; a task's index is its
+        # position in these columns
+        tweet_urls, comments = self._create_paired_tasks(tweet_links, reply_comments)
+        self._url_pool, self._url_idx = _intern(tweet_urls)
+        self._comment_pool, self._comment_idx = _intern(comments)
         
-        # Progress tracking
-        self.processed_tasks = set()  # Set of task indices that have been processed
-        self.successful_tasks = set()  # Set of task indices that were successful
-        self.failed_tasks = set()      # Set of task indices that failed
+        # Progress tracking: one byte per task (1 = processed / successful)
+        self.processed = bytearray(len(tweet_urls))
+        self.success = bytearray(len(tweet_urls))
         self.current_index = 0
         self.start_time = datetime.now().isoformat()
         self.last_updated = datetime.now().isoformat()
-    
-    def _create_paired_tasks(self) -> List[Dict]:
-        """Create paired tasks from tweet links and comments"""
-        paired_tasks = []
-        
-        # Ensure we have the same number of tweets and comments
-        max_length = max(len(self.tweet_links), len(self.reply_comments))
-        
-        for i in range(max_length):
-            tweet_url = self.tweet_links[i] if i < len(self.tweet_links) else ""
-            comment = self.reply_comments[i] if i < len(self.reply_comments) else ""
-            
-            if tweet_url.strip():  # Only add if tweet URL is not empty
-                paired_tasks.append({
-                    'index': i,
-                    'tweet_url': tweet_url.strip(),
-                    'comment': comment.strip(),
-                    'original_tweet_index': i,
-                    'original_comment_index': i
-                })
         
-        return paired_tasks
+        # Unsaved progress is flushed in batches (see maybe_save) and at exit
+        self._dirty = False
+        self._last_save = 0.0
+        self._flush_registered = False
+    
+    @staticmethod
+    def _create_paired_tasks(tweet_links: List[str], reply_comments: List[str]) -> Tuple[List[str], List[str]]:
+        """Pair tweet links with comments, skipping empty tweet URLs"""
+        tweet_urls = []
+        comments = []
+        
+        # Tweets without a matching comment get an empty one
+        for i, tweet_url in enumerate(tweet_links):
+            tweet_url = tweet_url.strip()
+            if tweet_url:  # Only add if tweet URL is not empty
+                tweet_urls.append(tweet_url)
+                comments.append(reply_comments[i].strip() if i < len(reply_comments) else "")
+        
+        return tweet_urls, comments
+    
+    @property
+    def paired_tasks(self) -> '_PairedView':
+        """Read-only sequence view of the paired tasks"""
+        return _PairedView(self)
+    
+    def get_task(self, task_index: int) -> Dict:
+        """Get a single paired task as a dict"""
+        return {
+            'index': task_index,
+            'tweet_url': self._url_pool[self._url_idx[task_index]],
+            'comment': self._comment_pool[self._comment_idx[task_index]]
+        }
     
     def get_remaining_tasks(self) -> List[Dict]:
         """Get tasks that haven't been processed yet"""
-        return [task for i, task in enumerate(self.paired_tasks) if i not in self.processed_tasks]
+        return [self.get_task(i) for i, done in enumerate(self.processed) if not done]
+    
+    def iter_remaining(self) -> Iterator[Dict]:
+        """Yield unprocessed tasks one at a time"""
+        for i, done in enumerate(self.processed):
+            if not done:
+                yield self.get_task(i)
+    
+    def count_remaining(self) -> int:
+        """Number of tasks that haven't been processed yet"""
+        return len(self.processed) - self.processed.count(1)
+    
+    def get_task_status(self, task_index: int) -> str:
+        """Get 'pending', 'success' or 'failed' for a task"""
+        if not self.processed[task_index]:
+            return 'pending'
+        return 'success' if self.success[task_index] else 'failed'
     
     def mark_task_processed(self, task_index: int, success: bool):
         """Mark a task as processed and track success/failure"""
-        self.processed_tasks.add(task_index)
-        if success:
-            self.successful_tasks.add(task_index)
-        else:
-            self.failed_tasks.add(task_index)
+        self.processed[task_index] = 1
+        self.success[task_index] = 1 if success else 0
         self.last_updated = datetime.now().isoformat()
+        self._dirty = True
+        if not self._flush_registered:
+            atexit.register(self.flush)
+            self._flush_registered = True
+    
+    def maybe_save(self, min_interval: float = 2.0) -> bool:
+        """Save pending progress if the last save is older than min_interval seconds"""
+        if self._dirty and time.monotonic() - self._last_save > min_interval:
+            self.save_state()
+            return True
+        return False
+    
+    def flush(self):
+        """Save pending progress, if any"""
+        if self._dirty:
+            self.save_state()
     
     def get_progress_stats(self) -> Dict:
         """Get current progress statistics"""
-        total_tasks = len(self.paired_tasks)
-        processed_count = len(self.processed_tasks)
-        successful_count = len(self.successful_tasks)
-        failed_count = len(self.failed_tasks)
+        total_tasks = len(self._url_idx)
+        processed_count = self.processed.count(1)
+        successful_count = self.success.count(1)
+        failed_count = processed_count - successful_count
         remaining_count = total_tasks - processed_count
         
         success_rate = (successful_count / total_tasks * 100) if total_tasks > 0 else 0
@@ -760,22 +942,25 @@ class AutomationState:
         state_data = {
             'task_id': self.task_id,
             'profile_name': self.profile_name,
-            'paired_tasks': self.paired_tasks,
+            'url_pool': self._url_pool,
+            'url_idx': list(self._url_idx),
+            'comment_pool': self._comment_pool,
+            'comment_idx': list(self._comment_idx),
+            'processed': list(self.processed),
+            'success': list(self.success),
             'actions': self.actions,
             'min_wait': self.min_wait,
             'max_wait': self.max_wait,
             'max_retries': self.max_retries,
-            'processed_tasks': list(self.processed_tasks),
-            'successful_tasks': list(self.successful_tasks),
-            'failed_tasks': list(self.failed_tasks),
             'current_index': self.current_index,
             'start_time': self.start_time,
             'last_updated': self.last_updated,
             'stats': stats
         }
         
-        with open(state_file, 'w', encoding='utf-8') as f:
-            json.dump(state_data, f, indent=2, ensure_ascii=False)
+        write_atomic(state_file, dumps(state_data))
+        self._dirty = False
+        self._last_save = time.monotonic()
     
     @classmethod
     def load_state(cls, task_id: str) -> Optional['AutomationState']:
@@ -785,33 +970,37 @@ class AutomationState:
             return None
         
         try:
-            with open(state_file, 'r', encoding='utf-8') as f:
-                state_data = json.load(f)
-            
-            # Reconstruct original lists from paired tasks
-            tweet_links = []
-            reply_comments = []
-            
-            for task in state_data['paired_tasks']:
-                tweet_links.append(task['tweet_url'])
-                reply_comments.append(task['comment'])
+            state_data = read_json(state_file)
             
             state = cls(
                 state_data['task_id'],
                 state_data['profile_name'],
-                tweet_links,
-                reply_comments,
+                [],
+                [],
                 state_data['actions'],
                 state_data['min_wait'],
                 state_data['max_wait'],
                 state_data['max_retries']
             )
             
+            if 'paired_tasks' in state_data:
+                # Older state files stored one dict per task plus index sets
+                tasks = state_data['paired_tasks']
+                processed_indices = set(state_data['processed_tasks'])
+                successful_indices = set(state_data['successful_tasks'])
+                state._url_pool, state._url_idx = _intern([task['tweet_url'] for task in tasks])
+                state._comment_pool, state._comment_idx = _intern([task['comment'] for task in tasks])
+                state.processed = bytearray(task['index'] in processed_indices for task in tasks)
+                state.success = bytearray(task['index'] in successful_indices for task in tasks)
+            else:
+                state._url_pool = state_data['url_pool']
+                state._url_idx = array('I', state_data['url_idx'])
+                state._comment_pool = state_data['comment_pool']
+                state._comment_idx = array('I', state_data['comment_idx'])
+                state.processed = bytearray(state_data['processed'])
+                state.success = bytearray(state_data['success'])
+            
             # Restore state
-            state.paired_tasks = state_data['paired_tasks']
-            state.processed_tasks = set(state_data['processed_tasks'])
-            state.successful_tasks = set(state_data['successful_tasks'])
-            state.failed_tasks = set(state_data['failed_tasks'])
             state.current_index = state_data['current_index']
             state.start_time = state_data['start_time']
             state.last_updated = state_data['last_updated']
@@ -823,6 +1012,12 @@ class AutomationState:
     
     def cleanup(self):
         """Clean up state file"""
+        # Don't let the exit flush recreate the file we are removing
+        if self._flush_registered:
+            atexit.unregister(self.flush)
+            self._flush_registered = False
+        self._dirty = False
+        
         state_file = f"automation_state_{self.task_id}.json"
         if os.path.exists(state_file):
             os.remove(state_file)
@@ -946,7 +1141,7 @@ class WebDashboard:
                     chrome_options,
                     stdout=subprocess.PIPE,
                     stderr=subprocess.PIPE,
-                    preexec_fn=os.setsid if platform.system() == "Linux" else None
+                    start_new_session=platform.system() == "Linux"
                 )
                 
                 # Wait a moment to see if Chrome starts successfully
@@ -1019,29 +1214,17 @@ class WebDashboard:
                 # Use GUI Chrome if configured and on Linux
                 use_gui = config.use_gui_chrome and os.name == 'posix'
                 if use_gui:
-                    current_task = get_task_status().get(task_id, {})
-                    current_logs = current_task.get('logs', [])
-                    current_logs.append(f"Setting up Chrome in GUI mode via VNC (display {config.vnc_display})")
-                    update_task_status(task_id, {'logs': current_logs})
+                    update_task_status(task_id, {'log_append': f"Setting up Chrome in GUI mode via VNC (display {config.vnc_display})"})
                 
                 chrome_available = scraper.setup_driver(use_gui=use_gui, display=config.vnc_display)
                 
                 if chrome_available:
                     if use_gui:
-                        current_task = get_task_status().get(task_id, {})
-                        current_logs = current_task.get('logs', [])
-                        current_logs.append("Chrome driver initialized successfully in GUI mode")
-                        update_task_status(task_id, {'logs': current_logs})
+                        update_task_status(task_id, {'log_append': "Chrome driver initialized successfully in GUI mode"})
                     else:
-                        current_task = get_task_status().get(task_id, {})
-                        current_logs = current_task.get('logs', [])
-                        current_logs.append("Chrome driver initialized successfully")
-                        update_task_status(task_id, {'logs': current_logs})
+                        update_task_status(task_id, {'log_append': "Chrome driver initialized successfully"})
                 else:
-                    current_task = get_task_status().get(task_id, {})
-                    current_logs = current_task.get('logs', [])
-                    current_logs.append("Chrome driver failed - using fallback requests-based scraping")
-                    update_task_status(task_id, {'logs': current_logs})
+                    update_task_status(task_id, {'log_append': "Chrome driver failed - using fallback requests-based scraping"})
                 
                 # Scrape tweets
                 scraped_content = []
@@ -1057,34 +1240,22 @@ class WebDashboard:
                         'progress': int((i / len(tweet_links)) * 100)
                     })
                     
-                    current_task = get_task_status().get(task_id, {})
-                    current_logs = current_task.get('logs', [])
-                    current_logs.append(f"Scraping tweet {i}/{len(tweet_links)}: {link}")
-                    update_task_status(task_id, {'logs': current_logs})
+                    update_task_status(task_id, {'log_append': f"Scraping tweet {i}/{len(tweet_links)}: {link}"})
                     
                     # Try scraping with retries
                     content = self._scrape_with_retries(scraper, link, max_retries)
                     
                     if content:
                         scraped_content.append(content)
-                        current_task = get_task_status().get(task_id, {})
-                        current_logs = current_task.get('logs', [])
-                        current_logs.append(f"✓ Successfully scraped tweet {i}")
-                        update_task_status(task_id, {'logs': current_logs})
+                        update_task_status(task_id, {'log_append': f"✓ Successfully scraped tweet {i}"})
                     else:
                         failed_links.append(link)
-                        current_task = get_task_status().get(task_id, {})
-                        current_logs = current_task.get('logs', [])
-                        current_logs.append(f"✗ Failed to scrape tweet {i}")
-                        update_task_status(task_id, {'logs': current_logs})
+                        update_task_status(task_id, {'log_append': f"✗ Failed to scrape tweet {i}"})
                     
                     # Random delay between tweets
                     if i < len(tweet_links):
                         delay = random.randint(3, 5)
-                        current_task = get_task_status().get(task_id, {})
-                        current_logs = current_task.get('logs', [])
-                        current_logs.append(f"Waiting {delay} seconds...")
-                        update_task_status(task_id, {'logs': current_logs})
+                        update_task_status(task_id, {'log_append': f"Waiting {delay} seconds..."})
                         time.sleep(delay)
                 
                 # Save scraped content
@@ -1092,13 +1263,11 @@ class WebDashboard:
                     for content in scraped_content:
                         f.write(f"{content}\n")
                 
-                update_task_status(task_id, {'status': 'completed'})
-                current_task = get_task_status().get(task_id, {})
-                current_logs = current_task.get('logs', [])
-                current_logs.append(f"Scraping completed! Successfully scraped: {len(scraped_content)} tweets")
-                current_logs.append(f"Failed: {len(failed_links)} tweets")
-                current_logs.append(f"Results saved to: {output_file}")
-                update_task_status(task_id, {'logs': current_logs})
+                update_task_status(task_id, {'status': 'completed', 'log_append': [
+                    f"Scraping completed! Successfully scraped: {len(scraped_content)} tweets",
+                    f"Failed: {len(failed_links)} tweets",
+                    f"Results saved to: {output_file}"
+                ]})
                 
                 # Clean up temporary file
                 if os.path.exists(temp_links_file):
@@ -1107,11 +1276,7 @@ class WebDashboard:
                 scraper.cleanup()
                 
             except Exception as e:
-                update_task_status(task_id, {'status': 'error'})
-                current_task = get_task_status().get(task_id, {})
-                current_logs = current_task.get('logs', [])
-                current_logs.append(f"Error: {str(e)}")
-                update_task_status(task_id, {'logs': current_logs})
+                update_task_status(task_id, {'status': 'error', 'log_append': f"Error: {str(e)}"})
                 scraper.cleanup()
             finally:
                 # Clean up thread reference
@@ -1156,53 +1321,37 @@ class WebDashboard:
             
             try:
                 # Log initialization
-                current_task = get_task_status().get(task_id, {})
-                current_logs = current_task.get('logs', [])
-                current_logs.append(f"🚀 Starting Twitter automation with profile: {profile_name}")
-                current_logs.append(f"📊 Configuration:")
-                current_logs.append(f"   • Total paired tasks: {len(state.paired_tasks)}")
-                current_logs.append(f"   • Actions: {actions}")
-                current_logs.append(f"   • Wait time: {min_wait}-{max_wait} seconds")
-                current_logs.append(f"   • Max retries: {max_retries}")
-                update_task_status(task_id, {'logs': current_logs})
+                update_task_status(task_id, {'log_append': [
+                    f"🚀 Starting Twitter automation with profile: {profile_name}",
+                    f"📊 Configuration:",
+                    f"   • Total paired tasks: {len(state.paired_tasks)}",
+                    f"   • Actions: {actions}",
+                    f"   • Wait time: {min_wait}-{max_wait} seconds",
+                    f"   • Max retries: {max_retries}"
+                ]})
                 
                 # Initialize automation strategy
                 strategy = StandardAutomationStrategy()
-                current_task = get_task_status().get(task_id, {})
-                current_logs = current_task.get('logs', [])
-                current_logs.append(f"🎯 Using strategy: {strategy.name}")
-                update_task_status(task_id, {'logs': current_logs})
+                update_task_status(task_id, {'log_append': f"🎯 Using strategy: {strategy.name}"})
                 
                 # Initialize automation
                 automation = TwitterAutomation(profile_name)
                 if not automation.setup_driver():
-                    update_task_status(task_id, {'status': 'error'})
-                    current_task = get_task_status().get(task_id, {})
-                    current_logs = current_task.get('logs', [])
-                    current_logs.append("❌ Failed to initialize Chrome driver")
-                    update_task_status(task_id, {'logs': current_logs})
+                    update_task_status(task_id, {'status': 'error', 'log_append': "❌ Failed to initialize Chrome driver"})
                     return
                 
-                current_task = get_task_status().get(task_id, {})
-                current_logs = current_task.get('logs', [])
-                current_logs.append("✅ Chrome driver initialized successfully")
-                update_task_status(task_id, {'logs': current_logs})
+                update_task_status(task_id, {'log_append': "✅ Chrome driver initialized successfully"})
                 
                 # Get remaining tasks and randomize order
                 remaining_tasks = state.get_remaining_tasks()
                 random.shuffle(remaining_tasks)
-                current_task = get_task_status().get(task_id, {})
-                current_logs = current_task.get('logs', [])
-                current_logs.append(f"🔄 Randomized processing order for {len(remaining_tasks)} remaining tasks")
-                update_task_status(task_id, {'logs': current_logs})
+                update_task_status(task_id, {'log_append': f"🔄 Randomized processing order for {len(remaining_tasks)} remaining tasks"})
                 
                 # Process tasks
                 for i, task in enumerate(remaining_tasks):
                     current_task = get_task_status().get(task_id, {})
                     if current_task.get('status') == 'cancelled':
-                        current_logs = current_task.get('logs', [])
-                        current_logs.append("⏹️ Automation cancelled by user")
-                        update_task_status(task_id, {'logs': current_logs})
+                        update_task_status(task_id, {'log_append': "⏹️ Automation cancelled by user"})
                         break
                     
                     task_index = task['index']
@@ -1216,13 +1365,13 @@ class WebDashboard:
                         'progress': int(((i + 1) / len(remaining_tasks)) * 100)
                     })
                     
-                    current_task = get_task_status().get(task_id, {})
-                    current_logs = current_task.get('logs', [])
-                    current_logs.append(f"📝 Processing task {i+1}/{len(remaining_tasks)}:")
-                    current_logs.append(f"   • Tweet: {tweet_url}")
+                    task_logs = [
+                        f"📝 Processing task {i+1}/{len(remaining_tasks)}:",
+                        f"   • Tweet: {tweet_url}"
+                    ]
                     if reply_comment:
-                        current_logs.append(f"   • Comment: {reply_comment}")
-                    update_task_status(task_id, {'logs': current_logs})
+                        task_logs.append(f"   • Comment: {reply_comment}")
+                    update_task_status(task_id, {'log_append': task_logs})
                     
                     # Process tweet with retry logic
                     success = self._process_tweet_with_retries(
@@ -1235,39 +1384,23 @@ class WebDashboard:
                     
                     if success:
                         automation.log_to_file("success_log.txt", f"SUCCESS: {tweet_url} | Comment: {reply_comment}")
-                        current_task = get_task_status().get(task_id, {})
-                        current_logs = current_task.get('logs', [])
-                        current_logs.append("✅ Task processed successfully")
-                        update_task_status(task_id, {'logs': current_logs})
+                        update_task_status(task_id, {'log_append': "✅ Task processed successfully"})
                     else:
                         automation.log_to_file("failure_log.txt", f"FAILURE: {tweet_url} | Comment: {reply_comment}")
-                        current_task = get_task_status().get(task_id, {})
-                        current_logs = current_task.get('logs', [])
-                        current_logs.append("❌ Task processing failed")
-                        update_task_status(task_id, {'logs': current_logs})
+                        update_task_status(task_id, {'log_append': "❌ Task processing failed"})
                     
                     # Log current stats
                     stats = state.get_progress_stats()
-                    current_task = get_task_status().get(task_id, {})
-                    current_logs = current_task.get('logs', [])
-                    current_logs.append(f"📈 Progress: {stats['processed_count']}/{stats['total_tasks']} completed ({stats['success_rate']:.1f}% success rate)")
-                    update_task_status(task_id, {'logs': current_logs})
+                    update_task_status(task_id, {'log_append': f"📈 Progress: {stats['processed_count']}/{stats['total_tasks']} completed ({stats['success_rate']:.1f}% success rate)"})
                     
-                    # Save state periodically
-                    if (i + 1) % 3 == 0:  # Save more frequently for better recovery
-                        state.save_state()
-                        current_task = get_task_status().get(task_id, {})
-                        current_logs = current_task.get('logs', [])
-                        current_logs.append("💾 Progress saved")
-                        update_task_status(task_id, {'logs': current_logs})
+                    # Save state periodically (batched by time, not per task)
+                    if state.maybe_save():
+                        update_task_status(task_id, {'log_append': "💾 Progress saved"})
                     
                     # Random wait between tasks (except for last task)
                     if i < len(remaining_tasks) - 1:
                         wait_time = random.randint(min_wait, max_wait)
-                        current_task = get_task_status().get(task_id, {})
-                        current_logs = current_task.get('logs', [])
-                        current_logs.append(f"⏳ Waiting {wait_time} seconds before next task...")
-                        update_task_status(task_id, {'logs': current_logs})
+                        update_task_status(task_id, {'log_append': f"⏳ Waiting {wait_time} seconds before next task..."})
                         time.sleep(wait_time)
                 
                 # Final state save
@@ -1276,24 +1409,18 @@ class WebDashboard:
                 # Log completion with final stats
                 final_stats = state.get_progress_stats()
                 
-                update_task_status(task_id, {'status': 'completed'})
-                current_task = get_task_status().get(task_id, {})
-                current_logs = current_task.get('logs', [])
-                current_logs.append(f"🎉 Automation completed!")
-                current_logs.append(f"📈 Final Results:")
-                current_logs.append(f"   • Total tasks: {final_stats['total_tasks']}")
-                current_logs.append(f"   • Successful: {final_stats['successful_count']}")
-                current_logs.append(f"   • Failed: {final_stats['failed_count']}")
-                current_logs.append(f"   • Success rate: {final_stats['success_rate']:.1f}%")
-                current_logs.append(f"   • Remaining: {final_stats['remaining_count']}")
-                update_task_status(task_id, {'logs': current_logs})
+                update_task_status(task_id, {'status': 'completed', 'log_append': [
+                    f"🎉 Automation completed!",
+                    f"📈 Final Results:",
+                    f"   • Total tasks: {final_stats['total_tasks']}",
+                    f"   • Successful: {final_stats['successful_count']}",
+                    f"   • Failed: {final_stats['failed_count']}",
+                    f"   • Success rate: {final_stats['success_rate']:.1f}%",
+                    f"   • Remaining: {final_stats['remaining_count']}"
+                ]})
                 
             except Exception as e:
-                update_task_status(task_id, {'status': 'error'})
-                current_task = get_task_status().get(task_id, {})
-                current_logs = current_task.get('logs', [])
-                current_logs.append(f"💥 Automation error: {str(e)}")
-                update_task_status(task_id, {'logs': current_logs})
+                update_task_status(task_id, {'status': 'error', 'log_append': f"💥 Automation error: {str(e)}"})
                 if state:
                     state.save_state()  # Save state even on error
             finally:
@@ -1351,33 +1478,21 @@ class WebDashboard:
                     return True
                 elif attempt < max_retries - 1:
                     failed_actions = set(enabled_actions) - set(successful_actions)
-                    current_task = get_task_status().get(task_id, {})
-                    current_logs = current_task.get('logs', [])
-                    current_logs.append(f"⚠️ Attempt {attempt + 1} failed for actions: {failed_actions}, retrying...")
-                    update_task_status(task_id, {'logs': current_logs})
+                    update_task_status(task_id, {'log_append': f"⚠️ Attempt {attempt + 1} failed for actions: {failed_actions}, retrying..."})
                     time.sleep(2)
                     continue
                 else:
                     failed_actions = set(enabled_actions) - set(successful_actions)
-                    current_task = get_task_status().get(task_id, {})
-                    current_logs = current_task.get('logs', [])
-                    current_logs.append(f"❌ All attempts failed for actions: {failed_actions}")
-                    update_task_status(task_id, {'logs': current_logs})
+                    update_task_status(task_id, {'log_append': f"❌ All attempts failed for actions: {failed_actions}"})
                     return False
                     
             except Exception as e:
                 if attempt < max_retries - 1:
-                    current_task = get_task_status().get(task_id, {})
-                    current_logs = current_task.get('logs', [])
-                    current_logs.append(f"⚠️ Attempt {attempt + 1} failed: {str(e)}, retrying...")
-                    update_task_status(task_id, {'logs': current_logs})
+                    update_task_status(task_id, {'log_append': f"⚠️ Attempt {attempt + 1} failed: {str(e)}, retrying..."})
                     time.sleep(2)
                     continue
                 else:
-                    current_task = get_task_status().get(task_id, {})
-                    current_logs = current_task.get('logs', [])
-                    current_logs.append(f"❌ Error processing tweet: {str(e)}")
-                    update_task_status(task_id, {'logs': current_logs})
+                    update_task_status(task_id, {'log_append': f"❌ Error processing tweet: {str(e)}"})
                     return False
         
         return False
@@ -1857,9 +1972,9 @@ def get_automation_state(task_id):
                     'task_id': state.task_id,
                     'profile_name': state.profile_name,
                     'total_tweets': len(state.paired_tasks),
-                    'processed_count': len(state.processed_tasks),
-                    'successful_count': len(state.successful_tasks),
-                    'failed_count': len(state.failed_tasks),
+                    'processed_count': state.processed.count(1),
+                    'successful_count': state.success.count(1),
+                    'failed_count': state.processed.count(1) - state.success.count(1),
                     'current_index': state.current_index,
                     'progress_percentage': state.get_progress_stats()['progress_percentage'],
                     'start_time': state.start_time,
@@ -1878,9 +1993,9 @@ def get_automation_state(task_id):
                         'task_id': state.task_id,
                         'profile_name': state.profile_name,
                         'total_tweets': len(state.paired_tasks),
-                        'processed_count': len(state.processed_tasks),
-                        'successful_count': len(state.successful_tasks),
-                        'failed_count': len(state.failed_tasks),
+                        'processed_count': state.processed.count(1),
+                        'successful_count': state.success.count(1),
+                        'failed_count': state.processed.count(1) - state.success.count(1),
                         'current_index': state.current_index,
                         'progress_percentage': state.get_progress_stats()['progress_percentage'],
                         'start_time': state.start_time,
@@ -1923,10 +2038,9 @@ def recover_automation(task_id):
         # Calculate remaining tweets
         remaining_tweets = []
         remaining_comments = []
-        for i, task in enumerate(state.paired_tasks):
-            if i not in state.processed_tasks:
-                remaining_tweets.append(task['tweet_url'])
-                remaining_comments.append(task['comment'])
+        for task in state.iter_remaining():
+            remaining_tweets.append(task['tweet_url'])
+            remaining_comments.append(task['comment'])
         
         if not remaining_tweets:
             return jsonify({
@@ -1999,21 +2113,9 @@ def get_automation_tasks(task_id):
         
         # Get detailed task information
         tasks_info = []
-        for i, task in enumerate(state.paired_tasks):
-            task_info = {
-                'index': i,
-                'tweet_url': task['tweet_url'],
-                'comment': task['comment'],
-                'status': 'pending'
-            }
-            
-            if i in state.processed_tasks:
-                if i in state.successful_tasks:
-                    task_info['status'] = 'success'
-                else:
-                    task_info['status'] = 'failed'
-            
-            tasks_info.append(task_info)
+        for task in state.paired_tasks:
+            task['status'] = state.get_task_status(task['index'])
+            tasks_info.append(task)
         
         stats = state.get_progress_stats()
         
@@ -2080,23 +2182,14 @@ def cancel_task(task_id):
     """Cancel a task"""
     all_tasks = get_task_status()  # Use task state manager
     if task_id in all_tasks:
-        # Mark task as cancelled
-        update_task_status(task_id, {'status': 'cancelled'})
-        
-        # Add cancellation log
-        current_task = get_task_status().get(task_id, {})
-        current_logs = current_task.get('logs', [])
-        current_logs.append("Task cancelled by user")
-        update_task_status(task_id, {'logs': current_logs})
+        # Mark task as cancelled and log it in one update (one save)
+        update_task_status(task_id, {'status': 'cancelled', 'log_append': "Task cancelled by user"})
         
         # Save automation state if it exists
         if task_id in automation_states:
             state = automation_states[task_id]
             state.save_state()
-            current_task = get_task_status().get(task_id, {})
-            current_logs = current_task.get('logs', [])
-            current_logs.append("Automation state saved for potential recovery")
-            update_task_status(task_id, {'logs': current_logs})
+            update_task_status(task_id, {'log_append': "Automation state saved for potential recovery"})
         
         # Terminate the thread if it's still running
         if task_id in active_threads:
@@ -2104,10 +2197,7 @@ def cancel_task(task_id):
             if thread.is_alive():
                 # Note: Python threads can't be forcefully terminated
                 # The thread will check the cancelled status and exit gracefully
-                current_task = get_task_status().get(task_id, {})
-                current_logs = current_task.get('logs', [])
-                current_logs.append("Thread termination requested")
-                update_task_status(task_id, {'logs': current_logs})
+                update_task_status(task_id, {'log_append': "Thread termination requested"})
             
             # Remove thread reference
             del active_threads[task_id]
@@ -2385,6 +2475,7 @@ startxfce4 &
                 '-geometry', '1920x1080', 
                 '-depth', '24'
             ], capture_output=True, text=True, timeout=30)
+            clear_vnc_status_cache()
             
             if result.returncode == 0:
                 # Get the server IP for dynamic display
@@ -2448,6 +2539,7 @@ def stop_vnc():
         try:
             result = subprocess.run(['vncserver', '-kill', ':1'], 
                                   capture_output=True, text=True, timeout=10)
+            clear_vnc_status_cache()
             
             if result.returncode == 0:
                 return jsonify({